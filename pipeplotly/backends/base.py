@@ -27,6 +27,23 @@ class PlotBackend(ABC):
         """
         pass
     
+    def display(self, figure):
+        """
+        Display a plot object previously returned by render().
+        
+        The default uses IPython's rich display when available and prints
+        the object otherwise; backends override it as needed.
+        
+        Args:
+            figure: The rendered plot object (specific to backend)
+        """
+        try:
+            from IPython.display import display
+        except ImportError:
+            print(figure)
+        else:
+            display(figure)
+    
     @abstractmethod
     def save(self, plot_state: PlotState, filename: str, 
              width: Optional[float] = None, height: Optional[float] = None,
@@ -1,9 +1,189 @@
 """
 Plotly Express backend implementation for interactive plots.
 """
+import os
+import sys
+from functools import lru_cache
 from typing import Optional
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.io as pio
 from pipeplotly.backends.base import PlotBackend
 from pipeplotly.core.state import PlotState
+from pipeplotly.themes.presets import get_theme_for_backend
+from pipeplotly.utils.downsample import lttb_indices
+
+# Scale name -> Plotly axis settings ('linear' needs none)
+_AXIS_SCALE_MAP = {
+    'log': {'type': 'log'},
+    'reverse': {'autorange': 'reversed'},
+}
+
+# Legend position -> Plotly legend settings
+_LEGEND_POSITION_MAP = {
+    'right': {'x': 1.02, 'y': 1, 'xanchor': 'left'},
+    'left': {'x': -0.02, 'y': 1, 'xanchor': 'right'},
+    'top': {'x': 0.5, 'y': 1.02, 'yanchor': 'bottom', 'xanchor': 'center', 'orientation': 'h'},
+    'bottom': {'x': 0.5, 'y': -0.02, 'yanchor': 'top', 'xanchor': 'center', 'orientation': 'h'},
+}
+
+# Point/line plots with more rows than this are downsampled before being
+# sent to the browser (opt out with ``downsample=False``)
+_DOWNSAMPLE_THRESHOLD = 50_000
+_DOWNSAMPLE_POINTS = 2_000
+# Beyond this many traces the per-trace selection costs more than it saves
+_DOWNSAMPLE_MAX_GROUPS = 100
+
+
+def _downsample(state: PlotState) -> pd.DataFrame:
+    """
+    Reduce a large point/line dataset with LTTB, per color/facet group.
+    
+    Returns the original data unchanged when x or y is not numeric/datetime,
+    when x is not sorted within each group or when there are too many groups.
+    """
+    data = state.data
+    x, y = data[state.x], data[state.y]
+    if not pd.api.types.is_numeric_dtype(y):
+        return data
+    if pd.api.types.is_datetime64_any_dtype(x):
+        x_vals = (x - x.iloc[0]).dt.total_seconds().to_numpy()
+    elif pd.api.types.is_numeric_dtype(x):
+        x_vals = x.to_numpy(dtype=np.float64)
+    else:
+        return data
+    y_vals = y.to_numpy(dtype=np.float64)
+    
+    # Downsample within each trace Plotly Express will draw: one per facet
+    # and per level of a discrete color (numeric colors form one trace)
+    group_cols = [col for col in (state.facet_rows, state.facet_cols) if col]
+    if state.color and data[state.color].dtype.kind not in 'iufc':
+        group_cols.append(state.color)
+    if group_cols:
+        grouped = data.groupby(group_cols, sort=False, observed=True, dropna=False)
+        if grouped.ngroups > _DOWNSAMPLE_MAX_GROUPS:
+            return data
+        groups = grouped.indices.values()
+    else:
+        groups = [np.arange(len(data))]
+    
+    keep = []
+    for idx in groups:
+        group_x = x_vals[idx]
+        if np.any(np.diff(group_x) < 0):
+            return data
+        n_out = max(3, _DOWNSAMPLE_POINTS * len(idx) // len(data))
+        keep.append(idx[lttb_indices(group_x, y_vals[idx], n_out)])
+    
+    return data.iloc[np.sort(np.concatenate(keep))]
+
+
+def _bar(state: PlotState, params: dict):
+    """Bar chart of y values, or a count plot when y is not mapped."""
+    if state.y is None:
+        return px.histogram(data_frame=state.data, x=state.x, 
+                            color=state.color if state.color else None)
+    return px.bar(**params)
+
+
+def _histogram(state: PlotState, params: dict):
+    """Histogram of x, honouring the optional ``bins`` parameter."""
+    bins = state.extra_params.get('bins', None)
+    hist_params = {'data_frame': state.data, 'x': state.x}
+    if state.color:
+        hist_params['color'] = state.color
+    if bins:
+        hist_params['nbins'] = bins
+    return px.histogram(**hist_params)
+
+
+def _density(state: PlotState, params: dict):
+    """Density approximation (Plotly has no direct density plot)."""
+    return px.histogram(data_frame=state.data, x=state.x, 
+                        marginal='violin',
+                        color=state.color if state.color else None)
+
+
+def _heatmap(state: PlotState, params: dict):
+    """Heatmap aggregated with density_heatmap."""
+    return px.density_heatmap(data_frame=state.data, 
+                              x=state.x, y=state.y,
+                              z=state.color if state.color else None)
+
+
+# Map geom_type to a builder taking (state, common Plotly Express params)
+_GEOM_DISPATCH = {
+    'point': lambda state, params: px.scatter(**params),
+    'line': lambda state, params: px.line(**params),
+    'bar': _bar,
+    'histogram': _histogram,
+    'box': lambda state, params: px.box(**params),
+    'violin': lambda state, params: px.violin(**params),
+    'density': _density,
+    'heatmap': _heatmap,
+}
+
+
+# Trace properties receiving the fixed (non-mapped) color and size per
+# geom_type; a single scalar is set on each trace rather than one value per row
+_FIXED_COLOR_PROPERTY = {
+    'point': 'marker_color', 'line': 'line_color', 'bar': 'marker_color',
+    'histogram': 'marker_color', 'box': 'marker_color', 'violin': 'marker_color',
+    'density': 'marker_color',
+}
+_FIXED_SIZE_PROPERTY = {'point': 'marker_size', 'line': 'line_width'}
+
+@lru_cache(maxsize=1)
+def _in_ipython() -> bool:
+    """Whether we are running inside an IPython/Jupyter session."""
+    ipython = sys.modules.get('IPython')
+    return ipython is not None and ipython.get_ipython() is not None
+
+
+def _should_show() -> bool:
+    """
+    Whether render() should display the figure.
+    
+    Displaying outside Jupyter writes a temporary HTML file and opens a
+    browser, which is wasted work in tests and batch jobs. Figures are shown
+    in IPython sessions and when stdout is a terminal, or always when the
+    PIPEPLOTLY_FORCE_SHOW environment variable is set.
+    """
+    if os.environ.get('PIPEPLOTLY_FORCE_SHOW'):
+        return True
+    isatty = getattr(sys.stdout, 'isatty', None)
+    return _in_ipython() or bool(isatty and isatty())
+
+
+def _save_html(fig, filename: str, width, height, dpi: int, kwargs: dict) -> None:
+    """Write the figure as standalone HTML."""
+    fig.write_html(filename, **kwargs)
+
+
+def _save_png(fig, filename: str, width, height, dpi: int, kwargs: dict) -> None:
+    """Write a PNG, converting width/height from inches to pixels."""
+    save_kwargs = {}
+    if width:
+        save_kwargs['width'] = int(width * dpi)
+    if height:
+        save_kwargs['height'] = int(height * dpi)
+    save_kwargs.update(kwargs)
+    fig.write_image(filename, **save_kwargs)
+
+
+def _save_image(fig, filename: str, width, height, dpi: int, kwargs: dict) -> None:
+    """Write a vector image (PDF/SVG)."""
+    fig.write_image(filename, **kwargs)
+
+
+# File extension -> writer taking (fig, filename, width, height, dpi, kwargs)
+_SAVE_DISPATCH = {
+    '.html': _save_html,
+    '.png': _save_png,
+    '.pdf': _save_image,
+    '.svg': _save_image,
+}
 
 
 class PlotlyBackend(PlotBackend):
@@ -18,27 +198,29 @@ class PlotlyBackend(PlotBackend):
         """
         Render the plot using Plotly Express and display it.
         
+        The figure is only displayed in interactive sessions (see
+        ``_should_show``); otherwise it is just built and returned.
+        
         Args:
             plot_state: The current plot state to render
             
         Returns:
             plotly.graph_objects.Figure
         """
-        import plotly.express as px
-        
-        plot_state.validate()
-        
-        # Create the figure based on geom_type
-        fig = self._create_figure(plot_state)
-        
-        # Apply customizations
-        fig = self._apply_layout(fig, plot_state)
-        
-        # Display
-        fig.show()
-        
+        fig = self._build_figure(plot_state)
+        self.display(fig)
         return fig
     
+    def display(self, figure):
+        """
+        Display a Plotly figure in interactive sessions (see ``_should_show``).
+        
+        Args:
+            figure: plotly.graph_objects.Figure returned by render()
+        """
+        if _should_show():
+            figure.show()
+    
     def save(self, plot_state: PlotState, filename: str, 
              width: Optional[float] = None, height: Optional[float] = None,
              dpi: int = 300, **kwargs):
@@ -53,26 +235,13 @@ class PlotlyBackend(PlotBackend):
             dpi: Resolution (not directly used by Plotly)
             **kwargs: Additional parameters
         """
-        fig = self.render(plot_state)
-        
-        # Determine format from filename
-        if filename.endswith('.html'):
-            fig.write_html(filename, **kwargs)
-        elif filename.endswith('.png'):
-            # Convert inches to pixels if width/height provided
-            save_kwargs = {}
-            if width:
-                save_kwargs['width'] = int(width * dpi)
-            if height:
-                save_kwargs['height'] = int(height * dpi)
-            fig.write_image(filename, **{**save_kwargs, **kwargs})
-        elif filename.endswith('.pdf'):
-            fig.write_image(filename, **kwargs)
-        elif filename.endswith('.svg'):
-            fig.write_image(filename, **kwargs)
-        else:
-            # Default to HTML
-            fig.write_html(filename, **kwargs)
+        # Build the figure without displaying it
+        fig = self._build_figure(plot_state)
+        
+        # Determine format from the file extension (HTML by default)
+        ext = os.path.splitext(filename)[1].lower()
+        writer = _SAVE_DISPATCH.get(ext, _save_html)
+        writer(fig, filename, width, height, dpi, kwargs)
     
     def to_html(self, plot_state: PlotState, filename: Optional[str] = None) -> str:
         """
@@ -85,10 +254,13 @@ class PlotlyBackend(PlotBackend):
         Returns:
             HTML string
         """
-        fig = self._create_figure(plot_state)
-        fig = self._apply_layout(fig, plot_state)
-        
-        html = fig.to_html()
+        plot_state.validate()
+        memo = plot_state._renders_memo()
+        html = memo.get('html')
+        if html is None:
+            fig = self._build_figure(plot_state)
+            # The figure was built by Plotly Express, so skip re-validating it
+            html = memo['html'] = pio.to_html(fig, validate=False)
         
         if filename:
             with open(filename, 'w', encoding='utf-8') as f:
@@ -96,10 +268,28 @@ class PlotlyBackend(PlotBackend):
         
         return html
     
+    def _build_figure(self, state: PlotState):
+        """
+        Validate the state and build the styled figure without displaying it.
+        
+        The figure is shared by later calls for the same state object, so
+        callers must not modify it.
+        """
+        state.validate()
+        
+        memo = state._renders_memo()
+        fig = memo.get('plotly_figure')
+        if fig is None:
+            # Create the figure based on geom_type
+            fig = self._create_figure(state)
+            
+            # Apply customizations
+            self._apply_fixed_aesthetics(fig, state)
+            fig = memo['plotly_figure'] = self._apply_layout(fig, state)
+        return fig
+    
     def _create_figure(self, state: PlotState):
         """Create Plotly Express figure based on geometry type."""
-        import plotly.express as px
-        
         # Build common parameters
         params = {
             'data_frame': state.data,
@@ -123,51 +313,37 @@ class PlotlyBackend(PlotBackend):
         if state.facet_cols:
             params['facet_col'] = state.facet_cols
         
-        # Create figure based on geometry type
-        geom_type = state.geom_type
+        # Downsample large point/line data before it is serialized
+        if (state.geom_type in ('point', 'line') and state.y is not None
+                and len(state.data) > _DOWNSAMPLE_THRESHOLD
+                and state.extra_params.get('downsample', True)):
+            params['data_frame'] = _downsample(state)
         
-        if geom_type == 'point':
-            fig = px.scatter(**params)
-        elif geom_type == 'line':
-            fig = px.line(**params)
-        elif geom_type == 'bar':
-            if state.y is None:
-                # Count plot
-                fig = px.histogram(data_frame=state.data, x=state.x, 
-                                  color=state.color if state.color else None)
-            else:
-                fig = px.bar(**params)
-        elif geom_type == 'histogram':
-            bins = state.extra_params.get('bins', None)
-            hist_params = {'data_frame': state.data, 'x': state.x}
-            if state.color:
-                hist_params['color'] = state.color
-            if bins:
-                hist_params['nbins'] = bins
-            fig = px.histogram(**hist_params)
-        elif geom_type == 'box':
-            fig = px.box(**params)
-        elif geom_type == 'violin':
-            fig = px.violin(**params)
-        elif geom_type == 'density':
-            # Plotly doesn't have a direct density plot, use histogram with KDE
-            # This is a simplified version
-            fig = px.histogram(data_frame=state.data, x=state.x, 
-                              marginal='violin',
-                              color=state.color if state.color else None)
-        elif geom_type == 'heatmap':
-            # For heatmap, we need a pivot or aggregation
-            # Simple version using density_heatmap
-            fig = px.density_heatmap(data_frame=state.data, 
-                                     x=state.x, y=state.y,
-                                     z=state.color if state.color else None)
-        else:
-            raise ValueError(f"Unsupported geometry type for Plotly: {geom_type}")
+        # Create figure based on geometry type
+        builder = _GEOM_DISPATCH.get(state.geom_type)
+        if builder is None:
+            raise ValueError(f"Unsupported geometry type for Plotly: {state.geom_type}")
         
-        return fig
+        return builder(state, params)
+    
+    def _apply_fixed_aesthetics(self, fig, state: PlotState) -> None:
+        """Set fixed color, size and alpha values as scalar trace properties."""
+        geom_type = state.geom_type
+        style = {}
+        if state.color_value and geom_type in _FIXED_COLOR_PROPERTY:
+            style[_FIXED_COLOR_PROPERTY[geom_type]] = state.color_value
+        if state.size_value and geom_type in _FIXED_SIZE_PROPERTY:
+            style[_FIXED_SIZE_PROPERTY[geom_type]] = state.size_value
+        if state.alpha_value is not None:
+            style['opacity'] = state.alpha_value
+        if style:
+            fig.update_traces(**style)
     
     def _apply_layout(self, fig, state: PlotState):
         """Apply layout customizations to the figure."""
+        x_scale, y_scale = state.x_scale, state.y_scale
+        x_limits, y_limits = state.x_limits, state.y_limits
+        legend_position = state.legend_position
         
         # Prepare layout updates
         layout_updates = {}
@@ -183,47 +359,27 @@ class PlotlyBackend(PlotBackend):
             layout_updates['yaxis_title'] = state.y_label
         
         # Axis ranges
-        if state.x_limits:
-            layout_updates['xaxis_range'] = list(state.x_limits)
-        if state.y_limits:
-            layout_updates['yaxis_range'] = list(state.y_limits)
+        if x_limits:
+            layout_updates['xaxis_range'] = list(x_limits)
+        if y_limits:
+            layout_updates['yaxis_range'] = list(y_limits)
         
         # Axis scales
-        if state.x_scale == 'log':
-            layout_updates['xaxis_type'] = 'log'
-        elif state.x_scale == 'reverse':
-            layout_updates['xaxis_autorange'] = 'reversed'
-        
-        if state.y_scale == 'log':
-            layout_updates['yaxis_type'] = 'log'
-        elif state.y_scale == 'reverse':
-            layout_updates['yaxis_autorange'] = 'reversed'
+        for axis, scale in (('xaxis', x_scale), ('yaxis', y_scale)):
+            for key, value in _AXIS_SCALE_MAP.get(scale, {}).items():
+                layout_updates[f'{axis}_{key}'] = value
         
         # Legend position
-        if state.legend_position == 'none':
+        if legend_position == 'none':
             layout_updates['showlegend'] = False
         else:
-            # Map position to Plotly legend settings
-            position_map = {
-                'right': {'x': 1.02, 'y': 1, 'xanchor': 'left'},
-                'left': {'x': -0.02, 'y': 1, 'xanchor': 'right'},
-                'top': {'x': 0.5, 'y': 1.02, 'yanchor': 'bottom', 'xanchor': 'center', 'orientation': 'h'},
-                'bottom': {'x': 0.5, 'y': -0.02, 'yanchor': 'top', 'xanchor': 'center', 'orientation': 'h'},
-            }
-            if state.legend_position in position_map:
-                layout_updates['legend'] = position_map[state.legend_position]
-        
-        # Apply theme template
-        theme_map = {
-            'default': 'plotly',
-            'minimal': 'simple_white',
-            'classic': 'plotly_white',
-            'dark': 'plotly_dark',
-            'light': 'plotly_white',
-            'void': 'none',
-        }
-        template = theme_map.get(state.theme, 'plotly')
-        layout_updates['template'] = template
+            legend = _LEGEND_POSITION_MAP.get(legend_position)
+            if legend is not None:
+                layout_updates['legend'] = dict(legend)
+        
+        # Apply theme template directly; update_layout is only needed when
+        # there are other settings
+        fig.layout.template = get_theme_for_backend(state.theme, 'plotly')
         
         # Apply all updates
         if layout_updates:
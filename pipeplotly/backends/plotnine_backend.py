@@ -1,9 +1,92 @@
 """
 plotnine backend implementation for static Grammar of Graphics plots.
 """
+import importlib.util
+from functools import lru_cache
 from typing import Optional
+import matplotlib
+import matplotlib.cm
+import matplotlib.colors as mcolors
+import pandas as pd
+import plotnine as p9
 from pipeplotly.backends.base import PlotBackend
 from pipeplotly.core.state import PlotState
+from pipeplotly.themes.presets import PLOTNINE_THEMES
+from pipeplotly.utils.smoothing import loess
+
+# Matplotlib colormaps usable as color palettes
+_MPL_CMAPS = frozenset({
+    'viridis', 'plasma', 'inferno', 'magma', 'cividis',
+    'twilight', 'coolwarm', 'seismic', 'rainbow', 'jet',
+})
+
+# Theme name -> plotnine theme function
+_THEME_MAP = {name: getattr(p9, f'theme_{theme}') for name, theme in PLOTNINE_THEMES.items()}
+
+
+@lru_cache(maxsize=128)
+def _sample_cmap_hex(palette: str, n_colors: int) -> tuple:
+    """Sample ``n_colors`` evenly spaced hex colors from a matplotlib colormap."""
+    # The colormap registry (matplotlib 3.5+) avoids importing pyplot
+    registry = getattr(matplotlib, 'colormaps', None)
+    cmap = registry[palette] if registry is not None else matplotlib.cm.get_cmap(palette)
+    step = n_colors - 1 if n_colors > 1 else 1
+    return tuple(mcolors.to_hex(cmap(i / step)) for i in range(n_colors))
+
+
+@lru_cache(maxsize=128)
+def _facet_wrap(column: str):
+    """Build (once per column) a facet_wrap spec; ggplot copies it when added."""
+    return p9.facet_wrap(f'~{column}')
+
+
+@lru_cache(maxsize=128)
+def _facet_grid(row_var: str, col_var: str):
+    """Build (once per row/col pair) a facet_grid spec; ggplot copies it when added."""
+    return p9.facet_grid(f'{row_var}~{col_var}')
+
+
+@lru_cache(maxsize=None)
+def _has_skmisc() -> bool:
+    """Whether scikit-misc, which plotnine needs for its own loess, is installed."""
+    return importlib.util.find_spec('skmisc') is not None
+
+
+def _loess_smoother(data: pd.DataFrame, xseq, params: dict) -> pd.DataFrame:
+    """geom_smooth method computing loess with pipeplotly's kernel (no standard errors)."""
+    fitted = loess(data['x'].to_numpy(), data['y'].to_numpy(), xseq, span=params['span'])
+    return pd.DataFrame({'x': xseq, 'y': fitted})
+
+
+def _bar(state: PlotState, aes_mapping, geom_params: dict):
+    """Column chart of y values, or a count bar chart when y is not mapped."""
+    if state.y is None:
+        return p9.geom_bar(aes_mapping, stat='count', **geom_params)
+    return p9.geom_col(aes_mapping, **geom_params)
+
+
+def _histogram(state: PlotState, aes_mapping, geom_params: dict):
+    """Histogram of x, honouring the optional ``bins`` parameter."""
+    bins = state.extra_params.get('bins', 30)
+    return p9.geom_histogram(aes_mapping, bins=bins, **geom_params)
+
+
+def _simple(geom_func):
+    """Adapt a plotnine geom that only needs the mapping and fixed params."""
+    return lambda state, aes_mapping, geom_params: geom_func(aes_mapping, **geom_params)
+
+
+# Map geom_type to a builder taking (state, aes mapping, fixed aesthetics)
+_GEOM_DISPATCH = {
+    'point': _simple(p9.geom_point),
+    'line': _simple(p9.geom_line),
+    'bar': _bar,
+    'histogram': _histogram,
+    'box': _simple(p9.geom_boxplot),
+    'violin': _simple(p9.geom_violin),
+    'density': _simple(p9.geom_density),
+    'heatmap': _simple(p9.geom_tile),
+}
 
 
 class PlotnineBackend(PlotBackend):
@@ -24,51 +107,25 @@ class PlotnineBackend(PlotBackend):
         Returns:
             plotnine ggplot object
         """
-        import plotnine as p9
-        
-        plot_state.validate()
-        
-        # Start with data
-        gg = p9.ggplot(plot_state.data)
-        
-        # Build aesthetic mapping
-        aes_mapping = self._build_aesthetics(plot_state)
-        
-        # Add geometry based on geom_type
-        geom = self._get_geometry(plot_state, aes_mapping)
-        gg = gg + geom
-        
-        # Add smooth if requested
-        if plot_state.smooth:
-            smooth_aes = p9.aes(x=plot_state.x, y=plot_state.y)
-            gg = gg + p9.geom_smooth(smooth_aes, method=plot_state.smooth_method, 
-                                     **plot_state.smooth_params)
-        
-        # Apply scales
-        gg = self._apply_scales(gg, plot_state)
-        
-        # Apply coordinate transformations
-        gg = self._apply_coords(gg, plot_state)
-        
-        # Apply facets
-        gg = self._apply_facets(gg, plot_state)
-        
-        # Apply labels
-        gg = self._apply_labels(gg, plot_state)
-        
-        # Apply theme
-        gg = self._apply_theme(gg, plot_state)
+        gg = self._build_plot(plot_state)
+        self.display(gg)
+        return gg
+    
+    def display(self, figure):
+        """
+        Display a plotnine plot.
         
-        # Display - Use IPython display for Jupyter notebooks
+        Args:
+            figure: plotnine ggplot object returned by render()
+        """
+        # Use IPython display for Jupyter notebooks
         try:
             from IPython.display import display
-            display(gg)
+            display(figure)
         except (ImportError, NameError):
             # Fallback for non-Jupyter environments
             # In regular Python, ggplot objects auto-display when evaluated
-            print(gg)
-        
-        return gg
+            print(figure)
     
     def save(self, plot_state: PlotState, filename: str, 
              width: Optional[float] = None, height: Optional[float] = None,
@@ -84,8 +141,8 @@ class PlotnineBackend(PlotBackend):
             dpi: Resolution
             **kwargs: Additional parameters
         """
-        # Render to get ggplot object
-        gg = self.render(plot_state)
+        # Build the ggplot object without displaying it
+        gg = self._build_plot(plot_state)
         
         # Save
         save_params = {'dpi': dpi, 'verbose': False}
@@ -94,12 +151,49 @@ class PlotnineBackend(PlotBackend):
         if height:
             save_params['height'] = height
         
-        gg.save(filename, **{**save_params, **kwargs})
+        save_params.update(kwargs)
+        gg.save(filename, **save_params)
+    
+    def _build_plot(self, plot_state: PlotState):
+        """Validate the state and build the ggplot object without displaying it."""
+        plot_state.validate()
+        
+        # Build aesthetic mapping
+        aes_mapping = self._build_aesthetics(plot_state)
+        
+        # Collect every component first; each ggplot + deep-copies the plot,
+        # so they are added in a single step at the end
+        layers = [self._get_geometry(plot_state, aes_mapping)]
+        
+        # Add smooth if requested
+        if plot_state.smooth:
+            smooth_aes = p9.aes(x=plot_state.x, y=plot_state.y)
+            method = plot_state.smooth_method
+            if method == 'loess' and not _has_skmisc():
+                # plotnine's loess needs scikit-misc; fit with our kernel instead
+                method = _loess_smoother
+            layers.append(p9.geom_smooth(smooth_aes, method=method, 
+                                         **plot_state.smooth_params))
+        
+        # Apply scales
+        self._apply_scales(layers, plot_state)
+        
+        # Apply coordinate transformations
+        self._apply_coords(layers, plot_state)
+        
+        # Apply facets
+        self._apply_facets(layers, plot_state)
+        
+        # Apply labels
+        self._apply_labels(layers, plot_state)
+        
+        # Apply theme
+        self._apply_theme(layers, plot_state)
+        
+        return p9.ggplot(plot_state.data) + layers
     
     def _build_aesthetics(self, state: PlotState) -> dict:
         """Build plotnine aesthetic mapping from state."""
-        import plotnine as p9
-        
         aes_dict = {}
         
         if state.x:
@@ -121,8 +215,6 @@ class PlotnineBackend(PlotBackend):
     
     def _get_geometry(self, state: PlotState, aes_mapping):
         """Get the appropriate plotnine geometry based on geom_type."""
-        import plotnine as p9
-        
         # Fixed aesthetics (non-mapped)
         geom_params = {}
         if state.color_value:
@@ -132,118 +224,91 @@ class PlotnineBackend(PlotBackend):
         if state.alpha_value:
             geom_params['alpha'] = state.alpha_value
         
-        geom_type = state.geom_type
+        builder = _GEOM_DISPATCH.get(state.geom_type)
+        if builder is None:
+            raise ValueError(f"Unsupported geometry type: {state.geom_type}")
         
-        if geom_type == 'point':
-            return p9.geom_point(aes_mapping, **geom_params)
-        elif geom_type == 'line':
-            return p9.geom_line(aes_mapping, **geom_params)
-        elif geom_type == 'bar':
-            if state.y is None:
-                return p9.geom_bar(aes_mapping, stat='count', **geom_params)
-            else:
-                return p9.geom_col(aes_mapping, **geom_params)
-        elif geom_type == 'histogram':
-            bins = state.extra_params.get('bins', 30)
-            return p9.geom_histogram(aes_mapping, bins=bins, **geom_params)
-        elif geom_type == 'box':
-            return p9.geom_boxplot(aes_mapping, **geom_params)
-        elif geom_type == 'violin':
-            return p9.geom_violin(aes_mapping, **geom_params)
-        elif geom_type == 'density':
-            return p9.geom_density(aes_mapping, **geom_params)
-        elif geom_type == 'heatmap':
-            return p9.geom_tile(aes_mapping, **geom_params)
-        else:
-            raise ValueError(f"Unsupported geometry type: {geom_type}")
+        return builder(state, aes_mapping, geom_params)
     
-    def _apply_scales(self, gg, state: PlotState):
+    def _apply_scales(self, layers: list, state: PlotState) -> None:
         """Apply scale transformations."""
-        import plotnine as p9
+        x_scale, y_scale = state.x_scale, state.y_scale
+        x_limits, y_limits = state.x_limits, state.y_limits
+        color, palette = state.color, state.color_palette
         
         # X scale
-        if state.x_scale == 'log':
-            gg = gg + p9.scale_x_log10()
-        elif state.x_scale == 'reverse':
-            gg = gg + p9.scale_x_reverse()
+        if x_scale == 'log':
+            layers.append(p9.scale_x_log10())
+        elif x_scale == 'reverse':
+            layers.append(p9.scale_x_reverse())
         
-        if state.x_limits:
-            gg = gg + p9.xlim(state.x_limits)
+        if x_limits:
+            layers.append(p9.xlim(x_limits))
         
         # Y scale
-        if state.y_scale == 'log':
-            gg = gg + p9.scale_y_log10()
-        elif state.y_scale == 'reverse':
-            gg = gg + p9.scale_y_reverse()
+        if y_scale == 'log':
+            layers.append(p9.scale_y_log10())
+        elif y_scale == 'reverse':
+            layers.append(p9.scale_y_reverse())
         
-        if state.y_limits:
-            gg = gg + p9.ylim(state.y_limits)
+        if y_limits:
+            layers.append(p9.ylim(y_limits))
         
         # Color palette
-        if state.color and state.color_palette:
-            if isinstance(state.color_palette, str):
+        if color and palette:
+            if isinstance(palette, str):
                 # Check if the color column is categorical or continuous
-                is_categorical = state.data[state.color].dtype.name in ['object', 'category', 'bool', 'str']
+                column = state.data[color]
+                dtype = column.dtype
+                is_categorical = (
+                    pd.api.types.is_object_dtype(dtype)
+                    or isinstance(dtype, pd.CategoricalDtype)
+                    or pd.api.types.is_bool_dtype(dtype)
+                    or pd.api.types.is_string_dtype(dtype)
+                )
                 
-                # Matplotlib colormaps
-                matplotlib_cmaps = ['viridis', 'plasma', 'inferno', 'magma', 'cividis', 
-                                   'twilight', 'coolwarm', 'seismic', 'rainbow', 'jet']
-                
-                if state.color_palette in matplotlib_cmaps:
+                if palette in _MPL_CMAPS:
                     if is_categorical:
-                        # For categorical data, sample discrete colors from the colormap
-                        import matplotlib.pyplot as plt
-                        n_colors = state.data[state.color].nunique()
-                        cmap = plt.get_cmap(state.color_palette)
-                        colors = [cmap(i / (n_colors - 1 if n_colors > 1 else 1)) for i in range(n_colors)]
-                        # Convert to hex
-                        import matplotlib.colors as mcolors
-                        colors_hex = [mcolors.to_hex(c) for c in colors]
-                        gg = gg + p9.scale_color_manual(values=colors_hex)
+                        # For categorical data, sample discrete colors from the colormap.
+                        # Categorical columns already know their levels.
+                        if isinstance(dtype, pd.CategoricalDtype):
+                            n_colors = len(dtype.categories)
+                        else:
+                            n_colors = column.nunique()
+                        colors_hex = _sample_cmap_hex(palette, n_colors)
+                        layers.append(p9.scale_color_manual(values=list(colors_hex)))
                     else:
                         # For continuous data, use colormap scale
-                        gg = gg + p9.scale_color_cmap(cmap_name=state.color_palette)
+                        layers.append(p9.scale_color_cmap(cmap_name=palette))
                 else:
                     # Try ColorBrewer palette (always discrete)
                     try:
-                        gg = gg + p9.scale_color_brewer(type='qual', palette=state.color_palette)
+                        layers.append(p9.scale_color_brewer(type='qual', palette=palette))
                     except (ValueError, AttributeError):
                         # If palette not found, skip it and use default
                         pass
             else:
                 # Custom color list
-                gg = gg + p9.scale_color_manual(values=state.color_palette)
-        
-        return gg
+                layers.append(p9.scale_color_manual(values=palette))
     
-    def _apply_coords(self, gg, state: PlotState):
+    def _apply_coords(self, layers: list, state: PlotState) -> None:
         """Apply coordinate system transformations."""
-        import plotnine as p9
-        
         if state.coord_flip:
-            gg = gg + p9.coord_flip()
+            layers.append(p9.coord_flip())
         elif state.coord_fixed:
-            gg = gg + p9.coord_fixed(ratio=state.coord_fixed)
-        
-        return gg
+            layers.append(p9.coord_fixed(ratio=state.coord_fixed))
     
-    def _apply_facets(self, gg, state: PlotState):
+    def _apply_facets(self, layers: list, state: PlotState) -> None:
         """Apply faceting."""
-        import plotnine as p9
-        
         if state.facet_wrap:
-            gg = gg + p9.facet_wrap(f'~{state.facet_wrap}')
+            layers.append(_facet_wrap(state.facet_wrap))
         elif state.facet_rows or state.facet_cols:
             row_var = state.facet_rows if state.facet_rows else '.'
             col_var = state.facet_cols if state.facet_cols else '.'
-            gg = gg + p9.facet_grid(f'{row_var}~{col_var}')
-        
-        return gg
+            layers.append(_facet_grid(row_var, col_var))
     
-    def _apply_labels(self, gg, state: PlotState):
+    def _apply_labels(self, layers: list, state: PlotState) -> None:
         """Apply labels to the plot."""
-        import plotnine as p9
-        
         labels = {}
         if state.title:
             labels['title'] = state.title
@@ -253,31 +318,15 @@ class PlotnineBackend(PlotBackend):
             labels['y'] = state.y_label
         
         if labels:
-            gg = gg + p9.labs(**labels)
-        
-        return gg
+            layers.append(p9.labs(**labels))
     
-    def _apply_theme(self, gg, state: PlotState):
+    def _apply_theme(self, layers: list, state: PlotState) -> None:
         """Apply theme to the plot."""
-        import plotnine as p9
-        
-        theme_map = {
-            'default': p9.theme_gray,
-            'minimal': p9.theme_minimal,
-            'classic': p9.theme_classic,
-            'dark': p9.theme_dark,
-            'light': p9.theme_light,
-            'void': p9.theme_void,
-            'bw': p9.theme_bw,
-        }
-        
-        theme_func = theme_map.get(state.theme, p9.theme_gray)
-        gg = gg + theme_func()
+        theme_func = _THEME_MAP.get(state.theme, p9.theme_gray)
+        layers.append(theme_func())
         
         # Apply legend position
         if state.legend_position == 'none':
-            gg = gg + p9.theme(legend_position='none')
+            layers.append(p9.theme(legend_position='none'))
         else:
-            gg = gg + p9.theme(legend_position=state.legend_position)
-        
-        return gg
+            layers.append(p9.theme(legend_position=state.legend_position))
@@ -4,9 +4,122 @@ Main Plot class for PipePlotly.
 This module provides the core Plot class that supports verb-based API
 for creating visualizations with method chaining and pipe operators.
 """
-from typing import Any, Optional, Union
-import pandas as pd
+import importlib
+import sys
+from functools import partial
+from typing import TYPE_CHECKING, Any, Optional, Union
 from pipeplotly.core.state import PlotState
+from pipeplotly.utils.helpers import set_if
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Backend name -> (module, class); modules are imported on first use only, so
+# users of one backend never pay the import cost of the other library
+_BACKEND_REGISTRY = {
+    'plotnine': ('pipeplotly.backends.plotnine_backend', 'PlotnineBackend'),
+    'plotly': ('pipeplotly.backends.plotly_backend', 'PlotlyBackend'),
+}
+
+# Backend instances, created on first use and shared by every Plot
+_BACKENDS = {}
+
+
+def _resolve_backend(name: str):
+    """Import and return the backend class registered for ``name``."""
+    try:
+        module_name, class_name = _BACKEND_REGISTRY[name]
+    except KeyError:
+        raise ValueError(f"Unknown backend: {name}") from None
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _get_backend(name: str):
+    """Return the shared backend instance for ``name``."""
+    backend = _BACKENDS.get(name)
+    if backend is None:
+        backend = _BACKENDS[name] = _resolve_backend(name)()
+    return backend
+
+
+def _is_pandas_frame(obj: Any) -> bool:
+    """
+    Whether ``obj`` is a pandas DataFrame, without importing pandas.
+    
+    An object can only be a DataFrame if pandas has already been imported,
+    so piping polars or other objects never pays the pandas import cost.
+    """
+    pd = sys.modules.get('pandas')
+    return pd is not None and isinstance(obj, pd.DataFrame)
+
+
+# State updates made by the aesthetic verbs
+
+def _color_updates(column=None, value=None, palette=None, **kwargs) -> dict:
+    """State updates for Plot.add_color."""
+    updates = {}
+    if column:
+        updates['color'] = column
+        updates['color_value'] = None  # Clear fixed value if mapping
+    if value:
+        updates['color_value'] = value
+        updates['color'] = None  # Clear mapping if fixed value
+    if palette:
+        updates['color_palette'] = palette
+    updates.update(kwargs)
+    return updates
+
+
+def _size_updates(column=None, value=None, **kwargs) -> dict:
+    """State updates for Plot.add_size."""
+    updates = {}
+    if isinstance(column, (int, float)):
+        updates['size_value'] = float(column)
+        updates['size'] = None  # Clear mapping
+    elif isinstance(column, str):
+        updates['size'] = column
+        updates['size_value'] = None  # Clear fixed value
+    
+    if value is not None:
+        updates['size_value'] = value
+        updates['size'] = None  # Clear mapping
+    updates.update(kwargs)
+    return updates
+
+
+def _shape_updates(column, **kwargs) -> dict:
+    """State updates for Plot.add_shape."""
+    return {'shape': column, **kwargs}
+
+
+def _alpha_updates(column=None, value=None, **kwargs) -> dict:
+    """State updates for Plot.add_alpha."""
+    updates = {}
+    if isinstance(column, (int, float)):
+        updates['alpha_value'] = float(column)
+        updates['alpha'] = None  # Clear mapping
+    elif isinstance(column, str):
+        updates['alpha'] = column
+        updates['alpha_value'] = None  # Clear fixed value
+    
+    if value is not None:
+        updates['alpha_value'] = value
+        updates['alpha'] = None  # Clear mapping
+    updates.update(kwargs)
+    return updates
+
+
+def _facet_updates(rows=None, cols=None, wrap=None, **kwargs) -> dict:
+    """State updates for Plot.add_facets."""
+    return {'facet_rows': rows, 'facet_cols': cols, 'facet_wrap': wrap, **kwargs}
+
+
+def _label_updates(title=None, x=None, y=None, **kwargs) -> dict:
+    """State updates for Plot.add_labels."""
+    updates = set_if({}, title=title, x_label=x, y_label=y)
+    updates.update(kwargs)
+    return updates
 
 
 class Plot:
@@ -33,7 +146,10 @@ class Plot:
         state (PlotState): The current plot configuration state
     """
     
-    def __init__(self, data: Optional[pd.DataFrame] = None, state: Optional[PlotState] = None):
+    # Every verb returns a new Plot, so keep instances small
+    __slots__ = ('_state', '_pending')
+    
+    def __init__(self, data: Optional['pd.DataFrame'] = None, state: Optional[PlotState] = None):
         """
         Initialize a Plot instance.
         
@@ -42,9 +158,33 @@ class Plot:
             state: Existing PlotState (used internally for creating copies)
         """
         if state is not None:
-            self.state = state
+            self._state = state
         else:
-            self.state = PlotState(data=data)
+            self._state = PlotState(data=data)
+        # Verb thunks piped in with >> but not applied yet (see __rshift__)
+        self._pending = ()
+    
+    @property
+    def state(self) -> PlotState:
+        """
+        The plot state, with any pending piped verbs applied.
+        
+        Pending verbs are applied on first access only, in a single copy
+        of the state; later accesses return the same PlotState object.
+        """
+        if self._pending:
+            verbs = _coalesce_verbs(self._pending)
+            if len(verbs) == 1:
+                self._state = verbs[0](Plot(state=self._state))._state
+            else:
+                self._state = self._state.copy(**_fold_verbs(verbs))
+            self._pending = ()
+        return self._state
+    
+    @state.setter
+    def state(self, state: PlotState) -> None:
+        self._state = state
+        self._pending = ()
     
     def _copy(self, **updates) -> 'Plot':
         """
@@ -59,6 +199,19 @@ class Plot:
         new_state = self.state.copy(**updates)
         return Plot(state=new_state)
     
+    def _with_field(self, name: str, value: Any) -> 'Plot':
+        """
+        Create a new Plot instance with a single state field replaced.
+        
+        Args:
+            name: Name of a PlotState field
+            value: New value for the field
+            
+        Returns:
+            New Plot instance with updated state
+        """
+        return Plot(state=self.state._with_field(name, value))
+    
     # ============================================================
     # INITIALIZATION VERBS - Define the plot type
     # ============================================================
@@ -71,6 +224,7 @@ class Plot:
             x: Column name for x-axis
             y: Column name for y-axis
             **kwargs: Additional parameters passed to the geometry
+                (``downsample=False`` keeps every point in large interactive plots)
             
         Returns:
             New Plot instance configured for scatter plot
@@ -88,6 +242,7 @@ class Plot:
             x: Column name for x-axis
             y: Column name for y-axis
             **kwargs: Additional parameters
+                (``downsample=False`` keeps every point in large interactive plots)
             
         Returns:
             New Plot instance configured for line plot
@@ -120,8 +275,9 @@ class Plot:
         Returns:
             New Plot instance configured for histogram
         """
-        extra = {'bins': bins} if bins else {}
-        return self._copy(geom_type='histogram', x=x, y=None, **{**extra, **kwargs})
+        if bins:
+            kwargs['bins'] = bins
+        return self._copy(geom_type='histogram', x=x, y=None, **kwargs)
     
     def plot_box(self, x: Optional[str] = None, y: Optional[str] = None, **kwargs) -> 'Plot':
         """
@@ -201,16 +357,7 @@ class Plot:
             >>> plot.add_color('species')  # Map to column
             >>> plot.add_color(value='red')  # Fixed color
         """
-        updates = {}
-        if column:
-            updates['color'] = column
-            updates['color_value'] = None  # Clear fixed value if mapping
-        if value:
-            updates['color_value'] = value
-            updates['color'] = None  # Clear mapping if fixed value
-        if palette:
-            updates['color_palette'] = palette
-        return self._copy(**{**updates, **kwargs})
+        return self._copy(**_color_updates(column, value, palette, **kwargs))
     
     def add_size(self, column: Optional[Union[str, float]] = None, value: Optional[float] = None, **kwargs) -> 'Plot':
         """
@@ -224,18 +371,7 @@ class Plot:
         Returns:
             New Plot instance with size aesthetic added
         """
-        updates = {}
-        if isinstance(column, (int, float)):
-            updates['size_value'] = float(column)
-            updates['size'] = None  # Clear mapping
-        elif isinstance(column, str):
-            updates['size'] = column
-            updates['size_value'] = None  # Clear fixed value
-            
-        if value is not None:
-            updates['size_value'] = value
-            updates['size'] = None  # Clear mapping
-        return self._copy(**{**updates, **kwargs})
+        return self._copy(**_size_updates(column, value, **kwargs))
     
     def add_shape(self, column: str, **kwargs) -> 'Plot':
         """
@@ -248,7 +384,9 @@ class Plot:
         Returns:
             New Plot instance with shape aesthetic added
         """
-        return self._copy(shape=column, **kwargs)
+        if not kwargs:
+            return self._with_field('shape', column)
+        return self._copy(**_shape_updates(column, **kwargs))
     
     def add_alpha(self, column: Optional[Union[str, float]] = None, value: Optional[float] = None, **kwargs) -> 'Plot':
         """
@@ -264,18 +402,7 @@ class Plot:
 
  aesthetic added
         """
-        updates = {}
-        if isinstance(column, (int, float)):
-            updates['alpha_value'] = float(column)
-            updates['alpha'] = None  # Clear mapping
-        elif isinstance(column, str):
-            updates['alpha'] = column
-            updates['alpha_value'] = None  # Clear fixed value
-            
-        if value is not None:
-            updates['alpha_value'] = value
-            updates['alpha'] = None  # Clear mapping
-        return self._copy(**{**updates, **kwargs})
+        return self._copy(**_alpha_updates(column, value, **kwargs))
     
     def add_facets(self, rows: Optional[str] = None, cols: Optional[str] = None, 
                    wrap: Optional[str] = None, **kwargs) -> 'Plot':
@@ -291,7 +418,7 @@ class Plot:
         Returns:
             New Plot instance with facets added
         """
-        return self._copy(facet_rows=rows, facet_cols=cols, facet_wrap=wrap, **kwargs)
+        return self._copy(**_facet_updates(rows, cols, wrap, **kwargs))
     
     def add_labels(self, title: Optional[str] = None, x: Optional[str] = None, 
                    y: Optional[str] = None, **kwargs) -> 'Plot':
@@ -307,14 +434,7 @@ class Plot:
         Returns:
             New Plot instance with labels updated
         """
-        updates = {}
-        if title is not None:
-            updates['title'] = title
-        if x is not None:
-            updates['x_label'] = x
-        if y is not None:
-            updates['y_label'] = y
-        return self._copy(**{**updates, **kwargs})
+        return self._copy(**_label_updates(title, x, y, **kwargs))
     
     def add_smooth(self, method: str = 'loess', **kwargs) -> 'Plot':
         """
@@ -335,19 +455,19 @@ class Plot:
     
     def scale_x_log(self) -> 'Plot':
         """Apply logarithmic scale to x-axis."""
-        return self._copy(x_scale='log')
+        return self._with_field('x_scale', 'log')
     
     def scale_y_log(self) -> 'Plot':
         """Apply logarithmic scale to y-axis."""
-        return self._copy(y_scale='log')
+        return self._with_field('y_scale', 'log')
     
     def scale_x_reverse(self) -> 'Plot':
         """Reverse the x-axis."""
-        return self._copy(x_scale='reverse')
+        return self._with_field('x_scale', 'reverse')
     
     def scale_y_reverse(self) -> 'Plot':
         """Reverse the y-axis."""
-        return self._copy(y_scale='reverse')
+        return self._with_field('y_scale', 'reverse')
     
     def xlim(self, min_val: float, max_val: float) -> 'Plot':
         """
@@ -360,7 +480,7 @@ class Plot:
         Returns:
             New Plot instance with x limits set
         """
-        return self._copy(x_limits=(min_val, max_val))
+        return self._with_field('x_limits', (min_val, max_val))
     
     def ylim(self, min_val: float, max_val: float) -> 'Plot':
         """
@@ -373,11 +493,11 @@ class Plot:
         Returns:
             New Plot instance with y limits set
         """
-        return self._copy(y_limits=(min_val, max_val))
+        return self._with_field('y_limits', (min_val, max_val))
     
     def coord_flip(self) -> 'Plot':
         """Flip the coordinate system (swap x and y axes)."""
-        return self._copy(coord_flip=True)
+        return self._with_field('coord_flip', True)
     
     def coord_fixed(self, ratio: float = 1.0) -> 'Plot':
         """
@@ -389,7 +509,7 @@ class Plot:
         Returns:
             New Plot instance with fixed coordinates
         """
-        return self._copy(coord_fixed=ratio)
+        return self._with_field('coord_fixed', ratio)
     
     # ============================================================
     # THEME VERBS - Customize appearance
@@ -405,7 +525,7 @@ class Plot:
         Returns:
             New Plot instance with theme set
         """
-        return self._copy(theme=theme)
+        return self._with_field('theme', theme)
     
     # ============================================================
     # OUTPUT VERBS - Render and export
@@ -415,20 +535,26 @@ class Plot:
         """
         Display the plot.
         
+        Interactive (Plotly) figures are not opened when running without
+        IPython and with stdout redirected (e.g. tests, batch jobs); set
+        the ``PIPEPLOTLY_FORCE_SHOW`` environment variable to always show.
+        Showing the same plot again redisplays the figure built the first
+        time; a new plot (e.g. after editing the DataFrame) is rebuilt.
+        
         Returns:
             Self for potential chaining
         """
-        self.state.validate()
+        state = self.state
+        state.validate()
         
-        # Import backend lazily
-        if self.state.backend == 'plotnine':
-            from pipeplotly.backends.plotnine_backend import PlotnineBackend
-            backend = PlotnineBackend()
-        else:
-            from pipeplotly.backends.plotly_backend import PlotlyBackend
-            backend = PlotlyBackend()
+        backend = _get_backend(state.backend)
         
-        backend.render(self.state)
+        memo = state._renders_memo()
+        figure = memo.get('shown')
+        if figure is None:
+            figure = memo['shown'] = backend.render(state)
+        else:
+            backend.display(figure)
         return self
     
     def save(self, filename: str, width: Optional[float] = None, 
@@ -448,13 +574,7 @@ class Plot:
         """
         self.state.validate()
         
-        # Import backend lazily
-        if self.state.backend == 'plotnine':
-            from pipeplotly.backends.plotnine_backend import PlotnineBackend
-            backend = PlotnineBackend()
-        else:
-            from pipeplotly.backends.plotly_backend import PlotlyBackend
-            backend = PlotlyBackend()
+        backend = _get_backend(self.state.backend)
         
         backend.save(self.state, filename, width=width, height=height, dpi=dpi, **kwargs)
         return self
@@ -466,7 +586,7 @@ class Plot:
         Returns:
             New Plot instance with Plotly backend
         """
-        return self._copy(backend='plotly')
+        return self._with_field('backend', 'plotly')
     
     def to_static(self) -> 'Plot':
         """
@@ -475,27 +595,23 @@ class Plot:
         Returns:
             New Plot instance with plotnine backend
         """
-        return self._copy(backend='plotnine')
+        return self._with_field('backend', 'plotnine')
     
     def to_html(self, filename: Optional[str] = None) -> str:
         """
         Export as HTML (primarily for interactive plots).
         
+        The plot is always rendered with Plotly. Exporting the same plot
+        again, from either backend, reuses the earlier HTML.
+        
         Args:
             filename: Optional filename to save HTML
             
         Returns:
             HTML string representation
         """
-        if self.state.backend != 'plotly':
-            # Convert to plotly first
-            plot = self.to_interactive()
-        else:
-            plot = self
-        
-        from pipeplotly.backends.plotly_backend import PlotlyBackend
-        backend = PlotlyBackend()
-        return backend.to_html(plot.state, filename)
+        backend = _get_backend('plotly')
+        return backend.to_html(self.state, filename)
     
     def __call__(self, data):
         """
@@ -522,12 +638,21 @@ class Plot:
         
         This allows: Plot(df) >> plot_points('x', 'y')
         
+        Verbs that only configure the plot are recorded and applied when
+        the state is first needed (e.g. by show, save or to_html), so a
+        pipeline builds no intermediate states it does not use. Output
+        verbs and other callables are applied immediately.
+        
         Args:
             other: Either a verb function or another operation
             
         Returns:
             Result of applying other to self
         """
+        if type(other) is partial and other.func in _DEFERRED_VERBS:
+            plot = Plot(state=self._state)
+            plot._pending = self._pending + (other,)
+            return plot
         if callable(other):
             return other(self)
         return NotImplemented
@@ -542,6 +667,8 @@ class Plot:
         
         When a DataFrame is piped into Plot(), this method is called
         because DataFrame doesn't have __rshift__ for Plot objects.
+        Any configuration already on the Plot is kept, so a prepared plot
+        can be reused for several DataFrames.
         
         Args:
             other: The object being piped (DataFrame, pipeframe, etc.)
@@ -550,20 +677,20 @@ class Plot:
             New Plot instance with the piped data
         """
         # Check if it's a pandas DataFrame
-        if isinstance(other, pd.DataFrame):
-            return Plot(data=other)
+        if _is_pandas_frame(other):
+            return self._with_field('data', other)
         
         # Check if it's a pipeframe DataFrame or similar (has _df or _data attribute)
         try:
-            if hasattr(other, '_data') and isinstance(other._data, pd.DataFrame):
+            if _is_pandas_frame(getattr(other, '_data', None)):
                 # pipeframe v0.2.0+ stores the underlying DataFrame in _data
-                return Plot(data=other._data)
-            elif hasattr(other, '_df') and isinstance(other._df, pd.DataFrame):
+                return self._with_field('data', other._data)
+            elif _is_pandas_frame(getattr(other, '_df', None)):
                 # Older pipeframe stores the underlying DataFrame in _df
-                return Plot(data=other._df)
+                return self._with_field('data', other._df)
             elif hasattr(other, 'to_pandas') and callable(other.to_pandas):
                 # Some libraries have to_pandas() method
-                return Plot(data=other.to_pandas())
+                return self._with_field('data', other.to_pandas())
         except (AttributeError, TypeError):
             pass
         
@@ -579,3 +706,141 @@ class Plot:
         backend = self.state.backend
         data_shape = self.state.data.shape if self.state.data is not None else 'None'
         return f"Plot(geom='{geom}', backend='{backend}', data_shape={data_shape})"
+
+
+# Plot methods that only return a reconfigured Plot; their pipe verbs are
+# deferred by Plot.__rshift__ until the state is needed
+_DEFERRED_VERBS = frozenset(
+    getattr(Plot, name) for name in (
+        'plot_points', 'plot_lines', 'plot_bars', 'plot_histogram', 'plot_box',
+        'plot_violin', 'plot_density', 'plot_heatmap',
+        'add_color', 'add_size', 'add_shape', 'add_alpha', 'add_facets',
+        'add_labels', 'add_smooth',
+        'scale_x_log', 'scale_y_log', 'scale_x_reverse', 'scale_y_reverse',
+        'xlim', 'ylim', 'coord_flip', 'coord_fixed',
+        'set_theme', 'to_interactive', 'to_static',
+    )
+)
+
+# Deferred verbs that overwrite a fixed group of state fields, by method:
+# (slot name, parameters the verb may be given). Only the last such verb
+# per slot in a pipeline needs to be applied.
+_VERB_SLOTS = {
+    Plot.add_shape: ('shape', ('column',)),
+    Plot.add_size: ('size', ('column', 'value')),
+    Plot.add_alpha: ('alpha', ('column', 'value')),
+    Plot.add_facets: ('facets', ('rows', 'cols', 'wrap')),
+    Plot.scale_x_log: ('x_scale', ()),
+    Plot.scale_x_reverse: ('x_scale', ()),
+    Plot.scale_y_log: ('y_scale', ()),
+    Plot.scale_y_reverse: ('y_scale', ()),
+    Plot.xlim: ('x_limits', ('min_val', 'max_val')),
+    Plot.ylim: ('y_limits', ('min_val', 'max_val')),
+    Plot.coord_flip: ('coord_flip', ()),
+    Plot.coord_fixed: ('coord_fixed', ('ratio',)),
+    Plot.set_theme: ('theme', ('theme',)),
+    Plot.to_interactive: ('backend', ()),
+    Plot.to_static: ('backend', ()),
+}
+
+
+def _verb_slot(verb: partial) -> Optional[str]:
+    """
+    The slot a deferred verb fully overwrites, or None if it must always run.
+    
+    Verbs given extra keyword arguments also write other fields, and
+    add_size/add_alpha only write their fields when given a mapping or a
+    value, so those are never skipped.
+    """
+    entry = _VERB_SLOTS.get(verb.func)
+    if entry is None or verb.args:
+        return None
+    slot, params = entry
+    keywords = verb.keywords
+    if any(name not in params for name in keywords):
+        return None
+    if slot in ('size', 'alpha'):
+        column = keywords.get('column')
+        if keywords.get('value') is None and not isinstance(column, (str, int, float)):
+            return None
+    return slot
+
+
+def _coalesce_verbs(verbs: tuple) -> list:
+    """Drop deferred verbs whose slot is overwritten by a later verb."""
+    seen = set()
+    kept = []
+    for verb in reversed(verbs):
+        slot = _verb_slot(verb)
+        if slot is not None:
+            if slot in seen:
+                continue
+            seen.add(slot)
+        kept.append(verb)
+    kept.reverse()
+    return kept
+
+
+class _PlotStateBuilder:
+    """
+    Stand-in for Plot that collects the updates of deferred verbs.
+    
+    Deferred verbs only change the state through ``_copy`` and
+    ``_with_field``, so calling them on a builder records their updates
+    in one dict instead of copying the state once per verb. Applying the
+    dict in a single copy has the same effect: later fields win and
+    unknown keys still end up in extra_params.
+    """
+    
+    __slots__ = ('updates',)
+    
+    def __init__(self):
+        self.updates = {}
+    
+    def _copy(self, **updates) -> '_PlotStateBuilder':
+        self.updates.update(updates)
+        return self
+    
+    def _with_field(self, name: str, value: Any) -> '_PlotStateBuilder':
+        self.updates[name] = value
+        return self
+
+
+def _fold_verbs(verbs: list) -> dict:
+    """Collect the state updates of deferred verbs, in order, into one dict."""
+    builder = _PlotStateBuilder()
+    for verb in verbs:
+        verb.func(builder, *verb.args, **verb.keywords)
+    return builder.updates
+
+
+def _compile_verbs(verbs: tuple) -> tuple:
+    """
+    Coalesce and fold a fixed verb sequence once, ahead of its use.
+    
+    Each run of deferrable verbs gets the same treatment as a pending
+    pipeline; any other callable (output verbs, nested pipelines) stays in
+    place and bounds the runs around it, so nothing moves across it.
+    """
+    compiled = []
+    run = []
+    for verb in verbs + (None,):
+        if type(verb) is partial and verb.func in _DEFERRED_VERBS:
+            run.append(verb)
+            continue
+        run = _coalesce_verbs(run)
+        if len(run) > 1:
+            compiled.append(partial(Plot._copy, **_fold_verbs(run)))
+        else:
+            compiled.extend(run)
+        run = []
+        if verb is not None:
+            compiled.append(verb)
+    return tuple(compiled)
+
+
+def _run_verbs(plot: Plot, verbs: tuple) -> Plot:
+    """Apply precompiled verbs to a plot in order."""
+    for verb in verbs:
+        plot = verb(plot)
+    return plot
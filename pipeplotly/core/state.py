@@ -1,22 +1,56 @@
 """
 Core state management for PipePlotly plots.
 """
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
-import pandas as pd
+import sys
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Tuple, Union
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-@dataclass
+# Use __slots__ for faster attribute access and smaller instances where
+# dataclasses support it (Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+# Accepted values of the option fields checked by PlotState.validate()
+_VALID_OPTIONS = {
+    'geom_type': frozenset({
+        'point', 'line', 'bar', 'histogram', 'box', 'violin', 'density', 'heatmap',
+    }),
+    'backend': frozenset({'plotnine', 'plotly'}),
+    'x_scale': frozenset({'linear', 'log', 'reverse'}),
+    'y_scale': frozenset({'linear', 'log', 'reverse'}),
+    'legend_position': frozenset({'right', 'left', 'top', 'bottom', 'inside', 'none'}),
+}
+
+# Figures and exported HTML are memoized on the PlotState they were built
+# from, so show, save and to_html of one plot build them once. Plots of more
+# rows than this are not memoized: their output holds a copy of every
+# column and is cheap to rebuild relative to its size
+_MEMO_MAX_ROWS = 100_000
+
+# Option fields that also take non-string values (e.g. legend coordinates),
+# which are passed to the backend unchecked
+_OPEN_OPTIONS = frozenset({'legend_position'})
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class PlotState:
     """
     Immutable state object for plot configuration.
     
     This dataclass holds all the information needed to render a plot,
     including data, aesthetics, layers, theme settings, and backend type.
+    Copies share the DataFrame and any list or dict values, so these must
+    be replaced rather than mutated in place. Fields should be changed with
+    copy(); a field assigned directly on a state that was already validated
+    or rendered is not picked up until ``validate(force=True)`` is called.
     """
     
     # Data
-    data: Optional[pd.DataFrame] = None
+    data: Optional['pd.DataFrame'] = None
     
     # Main geometry type
     geom_type: Optional[str] = None  # 'point', 'line', 'bar', etc.
@@ -78,54 +112,160 @@ class PlotState:
     # Additional parameters for specific plot types
     extra_params: Dict[str, Any] = field(default_factory=dict)
     
+    # Set by validate()
+    _validated: bool = field(default=False, init=False, repr=False, compare=False)
+    
+    # Artefacts rendered from this state object (see _renders_memo), never
+    # carried over to copies
+    _renders: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    
     def copy(self, **updates) -> 'PlotState':
         """
         Create a copy of this state with updated fields.
         
+        The copy is shallow: the DataFrame and any list or dict values are
+        shared with this state, which must therefore not be mutated in place.
+        Unknown parameters are merged into a new ``extra_params`` dict.
+        
         Args:
             **updates: Fields to update in the new state
             
         Returns:
             New PlotState instance with updates applied
         """
-        import copy
-        new_state = copy.deepcopy(self)
+        field_names = _field_names(type(self))
+        known = {}
+        extra = {}
         for key, value in updates.items():
-            if hasattr(new_state, key):
-                setattr(new_state, key, value)
+            if key in field_names:
+                if key in _INTERNED_FIELDS and type(value) is str:
+                    value = sys.intern(value)
+                known[key] = value
             else:
                 # Store unknown parameters in extra_params
-                new_state.extra_params[key] = value
+                extra[key] = value
+        if extra:
+            known['extra_params'] = {**known.get('extra_params', self.extra_params), **extra}
+        return replace(self, **known)
+    
+    def _with_field(self, name: str, value: Any) -> 'PlotState':
+        """
+        Copy of this state with a single known field replaced.
+        
+        Fast path for copy() used by single-field verbs: the field values are
+        transferred directly, skipping the update partitioning and the
+        generated __init__.
+        """
+        if name in _INTERNED_FIELDS and type(value) is str:
+            value = sys.intern(value)
+        new_state = object.__new__(type(self))
+        for field_name in _init_fields(type(self)):
+            object.__setattr__(new_state, field_name, getattr(self, field_name))
+        object.__setattr__(new_state, name, value)
+        object.__setattr__(new_state, '_validated', False)
+        object.__setattr__(new_state, '_renders', None)
+        return new_state
+    
+    def __deepcopy__(self, memo: dict) -> 'PlotState':
+        """
+        Copy for ``copy.deepcopy`` that shares the DataFrame.
+        
+        Walking the DataFrame would copy every block of data the verbs never
+        modify; only the parameter dicts are copied, one level deep.
+        """
+        new_state = object.__new__(type(self))
+        memo[id(self)] = new_state
+        for field_name in _init_fields(type(self)):
+            value = getattr(self, field_name)
+            if isinstance(value, dict):
+                value = dict(value)
+            object.__setattr__(new_state, field_name, value)
+        object.__setattr__(new_state, '_validated', self._validated)
+        object.__setattr__(new_state, '_renders', None)
         return new_state
     
-    def validate(self) -> None:
+    def _renders_memo(self) -> dict:
+        """
+        Dict for memoizing what the backends render from this state object.
+        
+        Entries only live as long as this object. Copies start empty, so a new
+        Plot built from a DataFrame edited in place is always rendered afresh.
+        Plots of more than ``_MEMO_MAX_ROWS`` rows get a throwaway dict.
+        """
+        if self.data is not None and len(self.data) > _MEMO_MAX_ROWS:
+            return {}
+        if self._renders is None:
+            self._renders = {}
+        return self._renders
+    
+    def validate(self, force: bool = False) -> None:
         """
         Validate the current plot state.
         
+        Validation is skipped if the state already passed, unless ``force``
+        is set. Forcing is needed after assigning a field directly, and also
+        drops the renders memoized for this state. Copies always start
+        unvalidated, so edits to the shared DataFrame are caught.
+        
+        Args:
+            force: Re-run the checks even if the state already passed
+        
         Raises:
             ValueError: If state is invalid (e.g., missing required fields)
         """
+        if self._validated and not force:
+            return
+        if force:
+            self._validated = False
+            self._renders = None
+        
         if self.data is None:
             raise ValueError("Plot data cannot be None")
         
         if self.geom_type is None:
             raise ValueError("Plot geometry type must be specified (use plot_points, plot_lines, etc.)")
         
-        # Validate that mapped aesthetics exist as columns
-        if self.x and isinstance(self.x, str) and self.x not in self.data.columns:
-            raise ValueError(f"Column '{self.x}' not found in data")
+        for name, valid in _VALID_OPTIONS.items():
+            value = getattr(self, name)
+            if name in _OPEN_OPTIONS and not isinstance(value, str):
+                continue
+            if value not in valid:
+                raise ValueError(
+                    f"Invalid {name} {value!r}; expected one of {', '.join(sorted(valid))}"
+                )
         
-        if self.y and isinstance(self.y, str) and self.y not in self.data.columns:
-            raise ValueError(f"Column '{self.y}' not found in data")
+        # Validate that mapped aesthetics and facet variables exist as
+        # columns, reporting all missing ones at once. Probing the Index
+        # directly uses pandas' cached hash table, which is far cheaper than
+        # converting it to a set.
+        columns = self.data.columns
+        missing = list(dict.fromkeys(
+            value for value in (self.x, self.y, self.color, self.size, self.shape, self.alpha,
+                                self.facet_rows, self.facet_cols, self.facet_wrap)
+            if value and isinstance(value, str) and value not in columns
+        ))
+        if len(missing) == 1:
+            raise ValueError(f"Column '{missing[0]}' not found in data")
+        if missing:
+            names = ', '.join(f"'{name}'" for name in missing)
+            raise ValueError(f"Columns {names} not found in data")
         
-        if self.color and isinstance(self.color, str) and self.color not in self.data.columns:
-            raise ValueError(f"Column '{self.color}' not found in data")
-        
-        if self.size and isinstance(self.size, str) and self.size not in self.data.columns:
-            raise ValueError(f"Column '{self.size}' not found in data")
-        
-        if self.shape and isinstance(self.shape, str) and self.shape not in self.data.columns:
-            raise ValueError(f"Column '{self.shape}' not found in data")
-        
-        if self.alpha and isinstance(self.alpha, str) and self.alpha not in self.data.columns:
-            raise ValueError(f"Column '{self.alpha}' not found in data")
+        self._validated = True
+
+
+@lru_cache(maxsize=None)
+def _init_fields(cls: type) -> Tuple[str, ...]:
+    """Names of the fields passed to the constructor of ``cls``, in declaration order."""
+    return tuple(f.name for f in fields(cls) if f.init)
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> FrozenSet[str]:
+    """Fields that copy() sets directly on ``cls``; other keys go to extra_params."""
+    return frozenset(_init_fields(cls))
+
+# Low-cardinality option fields whose values are interned by copy(), so
+# dispatch-table lookups and comparisons on them hit the identity fast path
+_INTERNED_FIELDS = frozenset({
+    'geom_type', 'backend', 'theme', 'x_scale', 'y_scale', 'legend_position',
+})
@@ -20,6 +20,15 @@ PLOTLY_THEMES = {
     'void': 'none',
 }
 
+# (theme name, backend) -> backend theme, resolved with a single lookup
+_BACKEND_THEMES = {
+    **{(name, 'plotnine'): theme for name, theme in PLOTNINE_THEMES.items()},
+    **{(name, 'plotly'): theme for name, theme in PLOTLY_THEMES.items()},
+}
+
+# Fallback theme per backend for unknown theme names
+_DEFAULT_THEMES = {'plotnine': 'gray', 'plotly': 'plotly'}
+
 # Common color palettes that work across backends
 COLOR_PALETTES = {
     'default': None,
@@ -41,12 +50,13 @@ def get_theme_for_backend(theme_name: str, backend: str) -> str:
     Returns:
         Theme string for the backend
     """
-    if backend == 'plotnine':
-        return PLOTNINE_THEMES.get(theme_name, 'gray')
-    elif backend == 'plotly':
-        return PLOTLY_THEMES.get(theme_name, 'plotly')
-    else:
-        raise ValueError(f"Unknown backend: {backend}")
+    theme = _BACKEND_THEMES.get((theme_name, backend))
+    if theme is not None:
+        return theme
+    try:
+        return _DEFAULT_THEMES[backend]
+    except KeyError:
+        raise ValueError(f"Unknown backend: {backend}") from None
 
 
 def get_color_palette(palette_name: str):
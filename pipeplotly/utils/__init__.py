@@ -1,6 +1,6 @@
 """Utils module initialization."""
 from pipeplotly.utils.validation import validate_dataframe, validate_column, validate_numeric_column
-from pipeplotly.utils.helpers import merge_dicts, clean_none_values
+from pipeplotly.utils.helpers import merge_dicts, clean_none_values, set_if
 
 __all__ = [
     'validate_dataframe',
@@ -8,4 +8,5 @@ __all__ = [
     'validate_numeric_column',
     'merge_dicts',
     'clean_none_values',
+    'set_if',
 ]
@@ -0,0 +1,130 @@
+"""Downsampling helpers for large line and scatter plots."""
+import numpy as np
+from pipeplotly.utils.jit import _compile_or_fallback
+
+# Selected on first use: a Numba-compiled scalar loop when numba is
+# installed, otherwise the NumPy implementation
+_kernel = None
+
+
+def _lttb_numpy(x: np.ndarray, y: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """LTTB bucket scan with NumPy vectorized over each bucket."""
+    n = len(x)
+    n_out = len(edges) + 1
+
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    selected = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+
+        # Average point of the next bucket (the last point for the final bucket)
+        if i + 2 < len(edges):
+            next_start, next_stop = edges[i + 1], edges[i + 2]
+            avg_x = x[next_start:next_stop].mean()
+            avg_y = y[next_start:next_stop].mean()
+        else:
+            avg_x, avg_y = x[n - 1], y[n - 1]
+
+        # Twice the triangle area for every candidate in the bucket
+        ax, ay = x[selected], y[selected]
+        area = np.abs(
+            (ax - avg_x) * (y[start:stop] - ay) - (ax - x[start:stop]) * (avg_y - ay)
+        )
+        selected = start + int(np.argmax(area))
+        indices[i + 1] = selected
+
+    return indices
+
+
+def _lttb_loop(x: np.ndarray, y: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """LTTB bucket scan as plain scalar loops, written to be compiled by Numba."""
+    n = x.shape[0]
+    n_buckets = edges.shape[0] - 1
+
+    indices = np.empty(n_buckets + 2, dtype=np.int64)
+    indices[0] = 0
+    indices[n_buckets + 1] = n - 1
+
+    selected = 0
+    for i in range(n_buckets):
+        start = edges[i]
+        stop = edges[i + 1]
+
+        if i + 1 < n_buckets:
+            next_stop = edges[i + 2]
+            avg_x = 0.0
+            avg_y = 0.0
+            for j in range(stop, next_stop):
+                avg_x += x[j]
+                avg_y += y[j]
+            avg_x /= next_stop - stop
+            avg_y /= next_stop - stop
+        else:
+            avg_x = x[n - 1]
+            avg_y = y[n - 1]
+
+        ax = x[selected]
+        ay = y[selected]
+        best = start
+        best_area = -1.0
+        for j in range(start, stop):
+            area = abs((ax - avg_x) * (y[j] - ay) - (ax - x[j]) * (avg_y - ay))
+            if area > best_area:
+                best_area = area
+                best = j
+        selected = best
+        indices[i + 1] = selected
+
+    return indices
+
+
+def _lttb_signature(types):
+    """Numba signature of the LTTB loop."""
+    values = types.Array(types.float64, 1, 'C', readonly=True)
+    edges = types.Array(types.int64, 1, 'C', readonly=True)
+    return types.int64[::1](values, values, edges)
+
+
+def _get_kernel():
+    """Return the LTTB kernel, compiling it with Numba on first use if available."""
+    global _kernel
+    if _kernel is None:
+        _kernel = _compile_or_fallback(_lttb_loop, _lttb_numpy, _lttb_signature)
+    return _kernel
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select points with the Largest-Triangle-Three-Buckets algorithm.
+
+    The first and last points are always kept. The points in between are
+    split into ``n_out - 2`` buckets, and from each bucket the point forming
+    the largest triangle with the previously selected point and the mean of
+    the next bucket is kept. This preserves the visual shape of a series
+    with far fewer points. ``x`` is expected to be sorted in ascending order.
+
+    The bucket scan is compiled with Numba when it is installed
+    (``pip install pipeplotly[fast]``) and runs on NumPy otherwise.
+
+    Args:
+        x: X values
+        y: Y values
+        n_out: Number of points to keep
+
+    Returns:
+        Sorted array of the selected positional indices
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    y = np.ascontiguousarray(y, dtype=np.float64)
+
+    # Bucket boundaries over the interior points 1 .. n-2
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+
+    return _get_kernel()(x, y, edges)
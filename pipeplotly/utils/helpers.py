@@ -12,6 +12,10 @@ def merge_dicts(*dicts: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Merged dictionary
     """
+    if len(dicts) == 2:
+        # Common case: merge in a single dict display
+        first, second = dicts
+        return {**(first or {}), **(second or {})}
     result = {}
     for d in dicts:
         if d:
@@ -30,3 +34,23 @@ def clean_none_values(d: Dict[str, Any]) -> Dict[str, Any]:
         Dictionary with None values removed
     """
     return {k: v for k, v in d.items() if v is not None}
+
+
+def set_if(d: Dict[str, Any], **pairs: Any) -> Dict[str, Any]:
+    """
+    Set the keys of a dictionary whose values are not None.
+    
+    Building a dictionary this way avoids inserting None values that would
+    otherwise have to be removed with ``clean_none_values``.
+    
+    Args:
+        d: Dictionary to update in place
+        **pairs: Keys and values to set
+        
+    Returns:
+        The updated dictionary
+    """
+    for key, value in pairs.items():
+        if value is not None:
+            d[key] = value
+    return d
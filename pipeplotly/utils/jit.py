@@ -0,0 +1,26 @@
+"""Optional Numba compilation for the scalar-loop kernels."""
+from typing import Any, Callable
+
+
+def _compile_or_fallback(loop: Callable, fallback: Callable,
+                         signature: Callable[[Any], Any]) -> Callable:
+    """
+    Compile a scalar loop with Numba, or return the fallback if it is missing.
+
+    The loop is compiled for an explicit signature (or loaded from the
+    on-disk cache) now rather than on its first call. Arrays should be
+    declared read-only so pandas-backed inputs match; writable ones convert.
+
+    Args:
+        loop: Implementation written as plain scalar loops
+        fallback: Implementation used when numba is not installed
+        signature: Function building the Numba signature from ``numba.types``
+
+    Returns:
+        The compiled loop, or ``fallback``
+    """
+    try:
+        from numba import njit, types
+    except ImportError:
+        return fallback
+    return njit(signature(types), cache=True)(loop)
@@ -1,9 +1,11 @@
 """Utility functions for data validation."""
-import pandas as pd
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-def validate_dataframe(df: pd.DataFrame, required_columns: Optional[List[str]] = None) -> None:
+
+def validate_dataframe(df: 'pd.DataFrame', required_columns: Optional[List[str]] = None) -> None:
     """
     Validate a DataFrame for use in plots.
     
@@ -15,6 +17,8 @@ def validate_dataframe(df: pd.DataFrame, required_columns: Optional[List[str]] =
         TypeError: If df is not a DataFrame
         ValueError: If required columns are missing
     """
+    import pandas as pd
+    
     if not isinstance(df, pd.DataFrame):
         raise TypeError(f"Expected pandas DataFrame, got {type(df)}")
     
@@ -27,7 +31,7 @@ def validate_dataframe(df: pd.DataFrame, required_columns: Optional[List[str]] =
             raise ValueError(f"Required columns missing from DataFrame: {missing}")
 
 
-def validate_column(df: pd.DataFrame, column: str, column_type: str = "column") -> None:
+def validate_column(df: 'pd.DataFrame', column: str, column_type: str = "column") -> None:
     """
     Validate that a column exists in a DataFrame.
     
@@ -49,7 +53,7 @@ def validate_column(df: pd.DataFrame, column: str, column_type: str = "column")
         )
 
 
-def validate_numeric_column(df: pd.DataFrame, column: str) -> None:
+def validate_numeric_column(df: 'pd.DataFrame', column: str) -> None:
     """
     Validate that a column is numeric.
     
@@ -60,6 +64,8 @@ def validate_numeric_column(df: pd.DataFrame, column: str) -> None:
     Raises:
         ValueError: If column is not numeric
     """
+    import pandas as pd
+    
     validate_column(df, column)
     if not pd.api.types.is_numeric_dtype(df[column]):
         raise ValueError(f"Column '{column}' must be numeric")
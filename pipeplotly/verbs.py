@@ -15,8 +15,25 @@ Examples:
     ...     >> add_color('category')
     ...     >> add_labels(title='My Plot')
     ...     >> show())
+    
+    Reusing a verb sequence:
+    >>> style = pipeline(add_color('category'), set_theme('minimal'))
+    >>> plot = df >> Plot() >> plot_points('x', 'y') >> style >> show()
 """
+from functools import partial
 from typing import Optional, Union
+from pipeplotly.core.plot import Plot, _compile_verbs, _run_verbs
+
+# Verbs without arguments return one shared thunk, so rebuilding a pipeline
+# does not allocate new ones
+_SCALE_X_LOG = partial(Plot.scale_x_log)
+_SCALE_Y_LOG = partial(Plot.scale_y_log)
+_SCALE_X_REVERSE = partial(Plot.scale_x_reverse)
+_SCALE_Y_REVERSE = partial(Plot.scale_y_reverse)
+_COORD_FLIP = partial(Plot.coord_flip)
+_SHOW = partial(Plot.show)
+_TO_INTERACTIVE = partial(Plot.to_interactive)
+_TO_STATIC = partial(Plot.to_static)
 
 
 # ============================================================
@@ -25,58 +42,42 @@ from typing import Optional, Union
 
 def plot_points(x: str, y: str, **kwargs):
     """Create a scatter plot."""
-    def _apply(plot):
-        return plot.plot_points(x, y, **kwargs)
-    return _apply
+    return partial(Plot.plot_points, x=x, y=y, **kwargs)
 
 
 def plot_lines(x: str, y: str, **kwargs):
     """Create a line plot."""
-    def _apply(plot):
-        return plot.plot_lines(x, y, **kwargs)
-    return _apply
+    return partial(Plot.plot_lines, x=x, y=y, **kwargs)
 
 
 def plot_bars(x: str, y: Optional[str] = None, **kwargs):
     """Create a bar chart."""
-    def _apply(plot):
-        return plot.plot_bars(x, y, **kwargs)
-    return _apply
+    return partial(Plot.plot_bars, x=x, y=y, **kwargs)
 
 
 def plot_histogram(x: str, bins: Optional[int] = None, **kwargs):
     """Create a histogram."""
-    def _apply(plot):
-        return plot.plot_histogram(x, bins=bins, **kwargs)
-    return _apply
+    return partial(Plot.plot_histogram, x=x, bins=bins, **kwargs)
 
 
 def plot_box(x: Optional[str] = None, y: Optional[str] = None, **kwargs):
     """Create a box plot."""
-    def _apply(plot):
-        return plot.plot_box(x, y, **kwargs)
-    return _apply
+    return partial(Plot.plot_box, x=x, y=y, **kwargs)
 
 
 def plot_violin(x: Optional[str] = None, y: Optional[str] = None, **kwargs):
     """Create a violin plot."""
-    def _apply(plot):
-        return plot.plot_violin(x, y, **kwargs)
-    return _apply
+    return partial(Plot.plot_violin, x=x, y=y, **kwargs)
 
 
 def plot_density(x: str, **kwargs):
     """Create a density plot."""
-    def _apply(plot):
-        return plot.plot_density(x, **kwargs)
-    return _apply
+    return partial(Plot.plot_density, x=x, **kwargs)
 
 
 def plot_heatmap(x: str, y: str, color: str, **kwargs):
     """Create a heatmap."""
-    def _apply(plot):
-        return plot.plot_heatmap(x, y, color, **kwargs)
-    return _apply
+    return partial(Plot.plot_heatmap, x=x, y=y, color=color, **kwargs)
 
 
 # ============================================================
@@ -86,53 +87,39 @@ def plot_heatmap(x: str, y: str, color: str, **kwargs):
 def add_color(column: Optional[str] = None, value: Optional[str] = None,
               palette: Optional[Union[str, list]] = None, **kwargs):
     """Map a column to color or set a fixed color."""
-    def _apply(plot):
-        return plot.add_color(column=column, value=value, palette=palette, **kwargs)
-    return _apply
+    return partial(Plot.add_color, column=column, value=value, palette=palette, **kwargs)
 
 
 def add_size(column: Optional[str] = None, value: Optional[float] = None, **kwargs):
     """Map a column to size or set a fixed size."""
-    def _apply(plot):
-        return plot.add_size(column=column, value=value, **kwargs)
-    return _apply
+    return partial(Plot.add_size, column=column, value=value, **kwargs)
 
 
 def add_shape(column: str, **kwargs):
     """Map a column to point shape."""
-    def _apply(plot):
-        return plot.add_shape(column, **kwargs)
-    return _apply
+    return partial(Plot.add_shape, column=column, **kwargs)
 
 
 def add_alpha(column: Optional[str] = None, value: Optional[float] = None, **kwargs):
     """Map a column to transparency or set fixed alpha."""
-    def _apply(plot):
-        return plot.add_alpha(column=column, value=value, **kwargs)
-    return _apply
+    return partial(Plot.add_alpha, column=column, value=value, **kwargs)
 
 
 def add_facets(rows: Optional[str] = None, cols: Optional[str] = None,
                wrap: Optional[str] = None, **kwargs):
     """Add faceting to create small multiples."""
-    def _apply(plot):
-        return plot.add_facets(rows=rows, cols=cols, wrap=wrap, **kwargs)
-    return _apply
+    return partial(Plot.add_facets, rows=rows, cols=cols, wrap=wrap, **kwargs)
 
 
 def add_labels(title: Optional[str] = None, x: Optional[str] = None,
                y: Optional[str] = None, **kwargs):
     """Add or modify plot labels."""
-    def _apply(plot):
-        return plot.add_labels(title=title, x=x, y=y, **kwargs)
-    return _apply
+    return partial(Plot.add_labels, title=title, x=x, y=y, **kwargs)
 
 
 def add_smooth(method: str = 'loess', **kwargs):
     """Add a smoothing trend line."""
-    def _apply(plot):
-        return plot.add_smooth(method=method, **kwargs)
-    return _apply
+    return partial(Plot.add_smooth, method=method, **kwargs)
 
 
 # ============================================================
@@ -141,58 +128,42 @@ def add_smooth(method: str = 'loess', **kwargs):
 
 def scale_x_log():
     """Apply logarithmic scale to x-axis."""
-    def _apply(plot):
-        return plot.scale_x_log()
-    return _apply
+    return _SCALE_X_LOG
 
 
 def scale_y_log():
     """Apply logarithmic scale to y-axis."""
-    def _apply(plot):
-        return plot.scale_y_log()
-    return _apply
+    return _SCALE_Y_LOG
 
 
 def scale_x_reverse():
     """Reverse the x-axis."""
-    def _apply(plot):
-        return plot.scale_x_reverse()
-    return _apply
+    return _SCALE_X_REVERSE
 
 
 def scale_y_reverse():
     """Reverse the y-axis."""
-    def _apply(plot):
-        return plot.scale_y_reverse()
-    return _apply
+    return _SCALE_Y_REVERSE
 
 
 def xlim(min_val: float, max_val: float):
     """Set x-axis limits."""
-    def _apply(plot):
-        return plot.xlim(min_val, max_val)
-    return _apply
+    return partial(Plot.xlim, min_val=min_val, max_val=max_val)
 
 
 def ylim(min_val: float, max_val: float):
     """Set y-axis limits."""
-    def _apply(plot):
-        return plot.ylim(min_val, max_val)
-    return _apply
+    return partial(Plot.ylim, min_val=min_val, max_val=max_val)
 
 
 def coord_flip():
     """Flip the coordinate system (swap x and y axes)."""
-    def _apply(plot):
-        return plot.coord_flip()
-    return _apply
+    return _COORD_FLIP
 
 
 def coord_fixed(ratio: float = 1.0):
     """Set fixed aspect ratio."""
-    def _apply(plot):
-        return plot.coord_fixed(ratio=ratio)
-    return _apply
+    return partial(Plot.coord_fixed, ratio=ratio)
 
 
 # ============================================================
@@ -201,9 +172,7 @@ def coord_fixed(ratio: float = 1.0):
 
 def set_theme(theme: str = 'default'):
     """Set the plot theme."""
-    def _apply(plot):
-        return plot.set_theme(theme=theme)
-    return _apply
+    return partial(Plot.set_theme, theme=theme)
 
 
 # ============================================================
@@ -212,35 +181,40 @@ def set_theme(theme: str = 'default'):
 
 def show():
     """Display the plot."""
-    def _apply(plot):
-        return plot.show()
-    return _apply
+    return _SHOW
 
 
 def save(filename: str, width: Optional[float] = None,
          height: Optional[float] = None, dpi: int = 300, **kwargs):
     """Save the plot to a file."""
-    def _apply(plot):
-        return plot.save(filename, width=width, height=height, dpi=dpi, **kwargs)
-    return _apply
+    return partial(Plot.save, filename=filename, width=width, height=height,
+                   dpi=dpi, **kwargs)
 
 
 def to_interactive():
     """Convert to interactive Plotly visualization.""" 
-    def _apply(plot):
-        return plot.to_interactive()
-    return _apply
+    return _TO_INTERACTIVE
 
 
 def to_static():
     """Convert to static plotnine visualization."""
-    def _apply(plot):
-        return plot.to_static()
-    return _apply
+    return _TO_STATIC
 
 
 def to_html(filename: Optional[str] = None):
     """Export as HTML."""
-    def _apply(plot):
-        return plot.to_html(filename=filename)
-    return _apply
+    return partial(Plot.to_html, filename=filename)
+
+
+# ============================================================
+# COMPOSITION VERBS
+# ============================================================
+
+def pipeline(*verbs):
+    """
+    Combine verbs into one reusable verb.
+    
+    The sequence is coalesced and fused once, here, so applying it to many
+    plots (e.g. on every dashboard refresh) skips that work each time.
+    """
+    return partial(_run_verbs, verbs=_compile_verbs(verbs))
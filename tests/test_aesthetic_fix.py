@@ -64,3 +64,12 @@ def test_state_clearing_color(df):
     plot = (plot >> add_color(value='red'))
     assert plot.state.color_value == 'red'
     assert plot.state.color is None
+
+def test_fixed_aesthetics_reach_plotly_traces(df):
+    """Test fixed color, size and alpha are set as scalar Plotly trace properties."""
+    from pipeplotly.backends.plotly_backend import PlotlyBackend
+    plot = Plot(df).plot_points('x', 'y').add_color(value='red').add_size(8).add_alpha(0.4)
+    trace = PlotlyBackend()._build_figure(plot.state).data[0]
+    assert trace.marker.color == 'red'
+    assert trace.marker.size == 8
+    assert trace.opacity == 0.4
@@ -0,0 +1,68 @@
+"""
+Tests for the LTTB downsampling helper.
+"""
+import numpy as np
+import pandas as pd
+from pipeplotly.utils.downsample import lttb_indices, _lttb_loop, _lttb_numpy
+
+
+class TestLttbIndices:
+    """Test Largest-Triangle-Three-Buckets point selection."""
+    
+    def test_keeps_endpoints_and_size(self):
+        """Test output has n_out sorted indices including first and last."""
+        x = np.arange(1000, dtype=float)
+        idx = lttb_indices(x, np.sin(x / 50), 100)
+        
+        assert len(idx) == 100
+        assert idx[0] == 0 and idx[-1] == 999
+        assert np.all(np.diff(idx) > 0)
+    
+    def test_keeps_spike(self):
+        """Test a single outlier survives downsampling."""
+        x = np.arange(1000, dtype=float)
+        y = np.zeros(1000)
+        y[517] = 10.0
+        
+        assert 517 in lttb_indices(x, y, 20)
+    
+    def test_small_input_unchanged(self):
+        """Test inputs no larger than n_out are returned whole."""
+        x = np.arange(10, dtype=float)
+        
+        assert list(lttb_indices(x, x, 50)) == list(range(10))
+    
+    def test_scalar_and_numpy_kernels_agree(self):
+        """Test the Numba-targeted loop selects the same points as the NumPy kernel."""
+        rng = np.random.default_rng(0)
+        x = np.sort(rng.random(5000))
+        y = np.cumsum(rng.normal(size=5000))
+        edges = np.linspace(1, 4999, 199).astype(np.int64)
+        
+        assert np.array_equal(_lttb_loop(x, y, edges), _lttb_numpy(x, y, edges))
+
+
+class TestPlotlyDownsample:
+    """Test per-trace downsampling in the Plotly backend."""
+    
+    def test_numeric_color_is_not_split_into_groups(self):
+        """Test a continuous color column is downsampled as a single trace."""
+        from pipeplotly import Plot
+        from pipeplotly.backends.plotly_backend import _downsample
+        
+        n = 60_000
+        df = pd.DataFrame({'x': np.arange(n), 'y': np.sin(np.arange(n) / 500),
+                           'c': np.random.default_rng(0).random(n)})
+        
+        assert len(_downsample(Plot(df).plot_points('x', 'y').add_color('c').state)) == 2_000
+    
+    def test_many_groups_are_left_unchanged(self):
+        """Test data with more color levels than the group limit is not downsampled."""
+        from pipeplotly import Plot
+        from pipeplotly.backends.plotly_backend import _downsample
+        
+        n = 60_000
+        df = pd.DataFrame({'x': np.arange(n), 'y': np.arange(n),
+                           'c': (np.arange(n) % 1000).astype(str)})
+        
+        assert _downsample(Plot(df).plot_points('x', 'y').add_color('c').state) is df
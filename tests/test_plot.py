@@ -1,6 +1,10 @@
 """
 Tests for the core Plot class.
 """
+import io
+import os
+import subprocess
+import sys
 import pytest
 import pandas as pd
 from pipeplotly import Plot
@@ -32,6 +36,12 @@ class TestPlotInitialization:
         
         assert 'point' in repr_str
         assert 'plotnine' in repr_str
+    
+    def test_plot_has_no_instance_dict(self):
+        """Test Plot instances use slots rather than a per-instance dict."""
+        plot = Plot(pd.DataFrame({'x': [1, 2, 3]}))
+        
+        assert not hasattr(plot, '__dict__')
 
 
 class TestInitializationVerbs:
@@ -214,6 +224,218 @@ class TestBackendSwitching:
         plot = base_plot.to_interactive().to_static()
         
         assert plot.state.backend == 'plotnine'
+    
+    def test_interactive_show_skips_display_when_not_interactive(self, base_plot, monkeypatch):
+        """Test show() builds but does not open Plotly figures in batch runs."""
+        import plotly.graph_objects as go
+        
+        def fail_show(*args, **kwargs):
+            raise AssertionError("figure should not be displayed")
+        
+        monkeypatch.delenv('PIPEPLOTLY_FORCE_SHOW', raising=False)
+        monkeypatch.setattr(sys, 'stdout', io.StringIO())
+        monkeypatch.setattr(go.Figure, 'show', fail_show)
+        plot = base_plot.to_interactive().show()
+        
+        assert isinstance(plot, Plot)
+    
+    def test_repeated_show_reuses_figure(self, base_plot, monkeypatch):
+        """Test showing an unchanged state twice builds the figure once."""
+        from pipeplotly.backends.plotly_backend import PlotlyBackend
+        
+        calls = []
+        build = PlotlyBackend._build_figure
+        
+        def counting_build(self, state):
+            calls.append(state)
+            return build(self, state)
+        
+        monkeypatch.delenv('PIPEPLOTLY_FORCE_SHOW', raising=False)
+        monkeypatch.setattr(sys, 'stdout', io.StringIO())
+        monkeypatch.setattr(PlotlyBackend, '_build_figure', counting_build)
+        plot = base_plot.to_interactive()
+        plot.show()
+        plot.show()
+        plot.set_theme('minimal').show()
+        
+        assert len(calls) == 2
+    
+    def test_toggling_backends_reuses_figures(self, base_plot, monkeypatch):
+        """Test re-showing the static and interactive form of a plot rebuilds nothing."""
+        from pipeplotly.backends.plotly_backend import PlotlyBackend
+        from pipeplotly.backends.plotnine_backend import PlotnineBackend
+        
+        calls = []
+        for backend in (PlotlyBackend, PlotnineBackend):
+            monkeypatch.setattr(backend, 'display', lambda self, figure: None)
+            monkeypatch.setattr(backend, 'render',
+                                lambda self, state: calls.append(state.backend) or object())
+        
+        interactive = base_plot.to_interactive()
+        for _ in range(2):
+            base_plot.show()
+            interactive.show()
+        
+        assert calls == ['plotnine', 'plotly']
+    
+    def test_show_rebuilds_new_plot_of_edited_data(self, base_plot, monkeypatch):
+        """Test a new plot of a DataFrame edited in place is not served a stale figure."""
+        from pipeplotly.backends.plotnine_backend import PlotnineBackend
+        
+        calls = []
+        monkeypatch.setattr(PlotnineBackend, 'display', lambda self, figure: None)
+        monkeypatch.setattr(PlotnineBackend, 'render',
+                            lambda self, state: calls.append(state) or object())
+        
+        data = base_plot.state.data
+        Plot(data).plot_points('x', 'y').show()
+        data['y'] *= 100
+        Plot(data).plot_points('x', 'y').show()
+        
+        assert len(calls) == 2
+    
+    def test_show_skips_memo_for_large_data(self, monkeypatch):
+        """Test showing a plot above the memo row cap again rebuilds the figure."""
+        from pipeplotly.backends.plotnine_backend import PlotnineBackend
+        from pipeplotly.core import state as state_module
+        
+        calls = []
+        monkeypatch.setattr(state_module, '_MEMO_MAX_ROWS', 2)
+        monkeypatch.setattr(PlotnineBackend, 'display', lambda self, figure: None)
+        monkeypatch.setattr(PlotnineBackend, 'render',
+                            lambda self, state: calls.append(state) or object())
+        
+        plot = Plot(pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]})).plot_points('x', 'y')
+        plot.show()
+        plot.show()
+        
+        assert len(calls) == 2
+    
+    def test_plotly_figure_reflects_in_place_data_edits(self):
+        """Test a new plot of a DataFrame edited in place is built from the new values."""
+        from pipeplotly.backends.plotly_backend import PlotlyBackend
+        
+        df = pd.DataFrame({'g': list('abcd'), 'y': [1, 2, 3, 4]})
+        backend = PlotlyBackend()
+        backend._build_figure(Plot(df).plot_bars('g', 'y').state)
+        df['y'] = [10, 20, 30, 40]
+        fig = backend._build_figure(Plot(df).plot_bars('g', 'y').set_theme('dark').state)
+        
+        assert list(fig.data[0].y) == [10, 20, 30, 40]
+    
+    def test_plotly_figure_built_once_per_state(self, base_plot, monkeypatch):
+        """Test saving and exporting the same state reuses its figure."""
+        from pipeplotly.backends.plotly_backend import PlotlyBackend
+        
+        calls = []
+        create = PlotlyBackend._create_figure
+        
+        def counting_create(self, state):
+            calls.append(state)
+            return create(self, state)
+        
+        monkeypatch.setattr(PlotlyBackend, '_create_figure', counting_create)
+        backend = PlotlyBackend()
+        state = base_plot.to_interactive().state
+        
+        assert backend._build_figure(state) is backend._build_figure(state)
+        state.title = 'Changed'
+        state.validate(force=True)
+        assert backend._build_figure(state).layout.title.text == 'Changed'
+        assert len(calls) == 2
+    
+    def test_repeated_to_html_reuses_export(self, base_plot, monkeypatch):
+        """Test exporting the same plot twice renders it once."""
+        from pipeplotly.backends.plotly_backend import PlotlyBackend
+        
+        calls = []
+        build = PlotlyBackend._build_figure
+        
+        def counting_build(self, state):
+            calls.append(state)
+            return build(self, state)
+        
+        monkeypatch.setattr(PlotlyBackend, '_build_figure', counting_build)
+        plot = base_plot.set_theme('dark')
+        html = plot.to_html()
+        
+        assert plot.to_html() == html
+        assert len(calls) == 1
+    
+    def test_to_html_reflects_in_place_data_edits(self, base_plot):
+        """Test exporting a new plot of a DataFrame edited in place gives new HTML."""
+        df = base_plot.state.data
+        html = Plot(df).plot_points('x', 'y').to_html()
+        df['y'] = -df['y']
+        
+        assert Plot(df).plot_points('x', 'y').to_html() != html
+    
+    def test_palette_levels_follow_in_place_data_edits(self):
+        """Test the sampled palette covers the current levels of an edited color column."""
+        from pipeplotly.backends.plotnine_backend import PlotnineBackend
+        
+        df = pd.DataFrame({'x': range(6), 'y': range(6), 'c': list('aabbaa')})
+        backend = PlotnineBackend()
+        backend._build_plot(Plot(df).plot_points('x', 'y').add_color('c', palette='viridis').state)
+        df['c'] = list('abcdef')
+        gg = backend._build_plot(
+            Plot(df).plot_points('x', 'y').add_color('c', palette='viridis').state
+        )
+        
+        scale = next(scale for scale in gg.scales if 'color' in scale.aesthetics)
+        assert len(scale.palette(6)) == 6
+    
+    def test_backend_subclass_without_display_is_instantiable(self):
+        """Test display() has a default so existing backend subclasses keep working."""
+        from pipeplotly.backends.base import PlotBackend
+        
+        class MinimalBackend(PlotBackend):
+            def render(self, plot_state):
+                return 'figure'
+            
+            def save(self, plot_state, filename, width=None, height=None, dpi=300, **kwargs):
+                pass
+        
+        assert MinimalBackend().render(None) == 'figure'
+    
+    def test_backends_not_imported_eagerly(self):
+        """Test importing pipeplotly does not import plotnine or Plotly."""
+        code = (
+            "import sys, pipeplotly; "
+            "print(any(m in sys.modules for m in ('plotnine', 'plotly')))"
+        )
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, '-c', code], cwd=repo_root,
+                                capture_output=True, text=True)
+        
+        assert result.stdout.strip() == 'False'
+    
+    def test_piping_non_pandas_object_skips_pandas_import(self):
+        """Test piping an object with to_pandas() does not import pandas to type-check it."""
+        code = (
+            "import sys; from pipeplotly import Plot\n"
+            "class Frame:\n"
+            "    def to_pandas(self): return 'converted'\n"
+            "plot = Frame() >> Plot()\n"
+            "print(plot.state.data, 'pandas' in sys.modules)"
+        )
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, '-c', code], cwd=repo_root,
+                                capture_output=True, text=True)
+        
+        assert result.stdout.strip() == 'converted False'
+    
+    def test_pandas_not_imported_eagerly(self):
+        """Test importing pipeplotly does not import pandas or NumPy."""
+        code = (
+            "import sys, pipeplotly; "
+            "print(any(m in sys.modules for m in ('pandas', 'numpy')))"
+        )
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, '-c', code], cwd=repo_root,
+                                capture_output=True, text=True)
+        
+        assert result.stdout.strip() == 'False'
 
 
 class TestMethodChaining:
@@ -250,6 +472,181 @@ class TestMethodChaining:
         assert isinstance(plot.plot_points('x', 'y'), Plot)
         assert isinstance(plot.plot_points('x', 'y').add_color(value='red'), Plot)
         assert isinstance(plot.plot_points('x', 'y').set_theme('minimal'), Plot)
+    
+    def test_chain_shares_data_and_keeps_parent_unchanged(self):
+        """Test that verbs share the DataFrame without mutating the parent state."""
+        df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]})
+        base = Plot(df).plot_histogram('x')
+        child = base.plot_histogram('x', bins=10)
+        
+        assert child.state.data is base.state.data
+        assert child.state.extra_params['bins'] == 10
+        assert 'bins' not in base.state.extra_params
+    
+    def test_single_field_verbs_match_general_copy(self):
+        """Test the single-field fast path builds the same state as copy()."""
+        df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]})
+        base = Plot(df).plot_points('x', 'y')
+        base.state.validate()
+        plot = base.scale_x_log().set_theme('minimal')
+        
+        assert plot.state == base.state.copy(x_scale='log', theme='minimal')
+        assert base.state.x_scale == 'linear'
+        assert plot.state._validated is False
+    
+    def test_deepcopy_shares_data(self):
+        """Test deep-copying a state shares the DataFrame but not the param dicts."""
+        import copy
+        
+        df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]})
+        state = Plot(df).plot_histogram('x', bins=5).state
+        clone = copy.deepcopy(state)
+        
+        assert clone == state
+        assert clone.data is state.data
+        assert clone.extra_params is not state.extra_params
+    
+    def test_copies_keep_subclass_fields(self):
+        """Test every copy path carries over the fields a PlotState subclass adds."""
+        import copy
+        from dataclasses import dataclass
+        from pipeplotly.core.state import _DATACLASS_OPTIONS
+        
+        @dataclass(**_DATACLASS_OPTIONS)
+        class NotedState(PlotState):
+            note: str = 'hi'
+        
+        df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]})
+        state = NotedState(data=df, geom_type='point', x='x', y='y', note='keep')
+        
+        assert state._with_field('theme', 'dark').note == 'keep'
+        assert copy.deepcopy(state).note == 'keep'
+        assert state.copy(note='new').note == 'new'
+        assert 'note' not in state.copy(note='new').extra_params
+    
+    def test_chain_shares_unchanged_param_dicts(self):
+        """Test verbs without extra parameters reuse the parent's param dicts."""
+        df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]})
+        base = Plot(df).plot_histogram('x', bins=10).add_smooth(span=0.5)
+        child = base.add_color(value='red').set_theme('minimal')
+        
+        assert child.state.extra_params is base.state.extra_params
+        assert child.state.smooth_params is base.state.smooth_params
+
+
+class TestPipeOperator:
+    """Test lazy application of piped verbs."""
+    
+    def test_piped_verbs_are_deferred_until_state_access(self):
+        """Test configuration verbs are recorded and applied on first state access."""
+        from pipeplotly.verbs import plot_points, add_color, xlim
+        
+        df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6], 'c': ['a', 'b', 'a']})
+        plot = df >> Plot() >> plot_points('x', 'y') >> add_color('c') >> xlim(0, 5)
+        
+        assert len(plot._pending) == 3
+        state = plot.state
+        assert (state.geom_type, state.color, state.x_limits) == ('point', 'c', (0, 5))
+        assert plot.state is state
+        assert plot._pending == ()
+    
+    def test_verbs_accept_unhashable_arguments(self):
+        """Test limit and theme verbs take arguments that cannot be hashed."""
+        from pipeplotly.verbs import xlim, ylim, coord_fixed
+        
+        df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]})
+        plot = df >> Plot() >> xlim([0], [5]) >> ylim(0, [6]) >> coord_fixed([2.0])
+        
+        assert plot.state.x_limits == ([0], [5])
+        assert plot.state.y_limits == (0, [6])
+        assert plot.state.coord_fixed == [2.0]
+    
+    def test_overwritten_verbs_are_skipped(self):
+        """Test only the last verb per overwritten setting is applied."""
+        from pipeplotly.core.plot import _coalesce_verbs
+        from pipeplotly.verbs import add_alpha, add_labels, set_theme
+        
+        df = pd.DataFrame({'x': [1, 2, 3], 'category': ['a', 'b', 'a']})
+        plot = (df >> Plot() >> add_alpha('category') >> add_labels(title='T')
+                >> add_alpha(0.5) >> set_theme('dark') >> add_alpha('category'))
+        
+        assert len(_coalesce_verbs(plot._pending)) == 3
+        assert plot.state.alpha == 'category'
+        assert plot.state.alpha_value is None
+        assert plot.state.title == 'T'
+    
+    def test_folded_verbs_match_method_chain(self):
+        """Test piped verbs applied in one state copy give the same state as chaining."""
+        from pipeplotly.core.state import PlotState
+        from pipeplotly.verbs import plot_points, add_color, add_size, add_labels, add_alpha
+        
+        df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6], 'c': ['a', 'b', 'a']})
+        piped = (df >> Plot() >> plot_points('x', 'y') >> add_color('c', palette='viridis')
+                 >> add_size(3) >> add_labels(title='T', note='n') >> add_color(value='red')
+                 >> add_alpha(0.5))
+        chained = (Plot(df).plot_points('x', 'y').add_color('c', palette='viridis')
+                   .add_size(3).add_labels(title='T', note='n').add_color(value='red')
+                   .add_alpha(0.5))
+        
+        copies = []
+        copy = PlotState.copy
+        
+        def counting_copy(self, **updates):
+            copies.append(updates)
+            return copy(self, **updates)
+        
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(PlotState, 'copy', counting_copy)
+            assert piped.state == chained.state
+        
+        assert len(copies) == 1
+    
+    def test_output_verbs_apply_immediately(self):
+        """Test output verbs run when piped rather than being deferred."""
+        from pipeplotly.verbs import plot_points, to_html
+        
+        df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]})
+        html = df >> Plot() >> plot_points('x', 'y') >> to_html()
+        
+        assert isinstance(html, str)
+    
+    def test_piping_data_into_configured_plot_keeps_configuration(self):
+        """Test df >> plot sets the data and keeps the plot's verbs."""
+        from pipeplotly.verbs import plot_points, set_theme
+        
+        template = Plot() >> plot_points('x', 'y') >> set_theme('dark')
+        df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]})
+        plot = df >> template
+        
+        assert plot.state.data is df
+        assert plot.state.geom_type == 'point'
+        assert plot.state.theme == 'dark'
+        assert (df >> Plot()).state == Plot(df).state
+    
+    def test_pipeline_is_compiled_once_and_reusable(self):
+        """Test a combined verb is precompiled and gives the same state as piping."""
+        from pipeplotly.verbs import pipeline, plot_points, add_color, add_size, set_theme, xlim
+        
+        style = pipeline(add_color('c'), add_size(3), set_theme('dark'),
+                         xlim(0, 5), set_theme('minimal'))
+        df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6], 'c': ['a', 'b', 'a']})
+        piped = (df >> Plot() >> plot_points('x', 'y') >> add_color('c') >> add_size(3)
+                 >> set_theme('dark') >> xlim(0, 5) >> set_theme('minimal'))
+        
+        assert len(style.keywords['verbs']) == 1
+        for _ in range(2):
+            assert (df >> Plot() >> plot_points('x', 'y') >> style).state == piped.state
+    
+    def test_pipeline_keeps_output_verbs_in_place(self):
+        """Test verbs are not coalesced across an output verb inside a pipeline."""
+        from pipeplotly.verbs import pipeline, plot_points, set_theme, to_html
+        
+        df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]})
+        export = pipeline(set_theme('dark'), to_html())
+        
+        assert isinstance(df >> Plot() >> plot_points('x', 'y') >> export, str)
+        assert len(pipeline(set_theme('dark'), to_html(), set_theme('minimal'))
+                   .keywords['verbs']) == 3
 
 
 class TestStateValidation:
@@ -278,6 +675,40 @@ class TestStateValidation:
         with pytest.raises(ValueError, match="not found in data"):
             plot.state.validate()
     
+    def test_validate_reports_all_missing_columns(self):
+        """Test validation names every missing column at once."""
+        df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]})
+        plot = Plot(df).plot_points('a', 'b').add_color('a')
+        
+        with pytest.raises(ValueError, match="Columns 'a', 'b' not found in data"):
+            plot.state.validate()
+    
+    def test_validate_missing_facet_column(self):
+        """Test validation also checks facet variables."""
+        df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]})
+        plot = Plot(df).plot_points('x', 'y').add_facets(wrap='group')
+        
+        with pytest.raises(ValueError, match="Column 'group' not found in data"):
+            plot.state.validate()
+    
+    def test_validate_rejects_unknown_option(self):
+        """Test validation fails for an unsupported scale."""
+        df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]})
+        state = Plot(df).plot_points('x', 'y').state
+        state.x_scale = 'sqrt'
+        
+        with pytest.raises(ValueError, match="Invalid x_scale 'sqrt'"):
+            state.validate()
+    
+    def test_validate_accepts_legend_coordinates(self):
+        """Test legend positions given as coordinates or 'inside' reach the backend."""
+        df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]})
+        for position in ((0.9, 0.9), 'inside'):
+            Plot(df).plot_points('x', 'y').state.copy(legend_position=position).validate()
+        
+        with pytest.raises(ValueError, match="Invalid legend_position 'middle'"):
+            Plot(df).plot_points('x', 'y').state.copy(legend_position='middle').validate()
+    
     def test_validate_success(self):
         """Test validation succeeds with valid state."""
         df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]})
@@ -285,6 +716,28 @@ class TestStateValidation:
         
         # Should not raise
         plot.state.validate()
+    
+    def test_validate_rechecks_after_field_change(self):
+        """Test a forced validation re-checks a field assigned after validating."""
+        df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]})
+        state = Plot(df).plot_points('x', 'y').state
+        state.validate()
+        
+        state.y = 'nonexistent'
+        with pytest.raises(ValueError, match="not found in data"):
+            state.validate(force=True)
+        with pytest.raises(ValueError, match="not found in data"):
+            state.copy(title='T').validate()
+    
+    def test_copies_recheck_columns_dropped_in_place(self):
+        """Test a copy of a validated state catches a column dropped from the shared data."""
+        df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6], 'c': list('abc')})
+        plot = Plot(df).plot_points('x', 'y').add_color('c')
+        plot.state.validate()
+        df.drop(columns='c', inplace=True)
+        
+        with pytest.raises(ValueError, match="Column 'c' not found in data"):
+            plot.set_theme('dark').state.validate()
 
 
 if __name__ == '__main__':